@@ -20,7 +20,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from src.core.config import AppConfig, load_config
 from src.core.chat_window import AsyncChatWindow, SessionDialog
@@ -28,7 +30,7 @@ from src.service.llm.engine import LLMEngine
 from src.service.tts.engine import TTSEngine
 from src.service.stt.engine import STTEngine
 from src.db.db_manager import ChatDatabase
-from src.orchestrator.conversation import run_turn_with_window
+from src.orchestrator.conversation import close_memory_updates, run_turn_with_window
 from src.utils.plugins.dynamic_personality.status_manager import StatusManager
 
 log = logging.getLogger(__name__)
@@ -89,7 +91,9 @@ async def _chat_loop(config: AppConfig, llm: LLMEngine) -> None:
     else:
         window.set_status(f"Session: {session_name}")
 
-    # Load previous messages if continuing a session
+    # Load previous messages if continuing a session — kept in memory and
+    # extended by each turn, so the database is only read once per session
+    history: list[dict[str, str]] = []
     if continuing:
         history = await db.get_history()
         for msg in history:
@@ -122,13 +126,15 @@ async def _chat_loop(config: AppConfig, llm: LLMEngine) -> None:
 
             # Run conversation turn with memory system
             await run_turn_with_window(
-                user_input, llm, tts, db, config, window, status
+                user_input, llm, tts, db, config, window, status,
+                history=history,
             )
 
     except KeyboardInterrupt:
         log.info("Interrupted by user")
     finally:
         window.close()
+        await close_memory_updates()
         if stt:
             await stt.stop_listening()
         await tts.shutdown()
@@ -153,20 +159,29 @@ async def main_loop() -> None:
 
 def run() -> None:
     """Configure logging and start the async loop."""
-    # Log to both terminal and file
+    # Log to both terminal and file. Records are formatted by the
+    # QueueHandler and written by a listener thread, so neither the event
+    # loop nor the audio capture thread blocks on log I/O.
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    listener = QueueListener(
+        log_queue,
+        logging.FileHandler("rin_debug.log", encoding="utf-8"),
+        logging.StreamHandler(sys.stderr),
+    )
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=[
-            logging.FileHandler("rin_debug.log", encoding="utf-8"),
-            logging.StreamHandler(sys.stderr),
-        ],
+        handlers=[QueueHandler(log_queue)],
     )
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("openai").setLevel(logging.WARNING)
+    listener.start()
 
     print("Starting Project Rin...")
     print("Chat window will open. Logs will appear here.")
     print("-" * 50)
 
-    asyncio.run(main_loop())
+    try:
+        asyncio.run(main_loop())
+    finally:
+        listener.stop()  # flushes remaining records
@@ -10,15 +10,25 @@ from __future__ import annotations
 import asyncio
 import queue
 import threading
+import time
 import tkinter as tk
-from datetime import datetime
-from tkinter import scrolledtext, font as tkfont
+from collections import deque
+from tkinter import scrolledtext, ttk, font as tkfont
 from typing import Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.service.stt.engine import STTEngine
     from src.db.db_manager import SessionInfo
 
+# GUI polling while waiting for input: fast while the user is interacting
+# with the window, slower once it has been idle for a while
+_POLL_ACTIVE = 0.016   # ~60fps
+_POLL_IDLE = 0.1
+_IDLE_AFTER = 1.0      # seconds without input events before backing off
+
+# Streamed AI chunks are inserted at most this often (~30fps)
+_REDRAW_INTERVAL_MS = 33
+
 
 class SessionDialog:
     """Dialog for selecting a session to continue or creating a new one."""
@@ -91,86 +101,106 @@ class SessionDialog:
         list_frame = tk.Frame(self.root, bg=self.BG_COLOR, padx=20)
         list_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Scrollable canvas for session list
-        canvas = tk.Canvas(list_frame, bg=self.TEXT_BG, highlightthickness=0)
-        scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        self.session_frame = tk.Frame(canvas, bg=self.TEXT_BG)
-
-        self.session_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=self.session_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
         # Populate sessions
         if not self.sessions:
             no_sessions = tk.Label(
-                self.session_frame,
+                list_frame,
                 text="No previous sessions",
                 font=("Consolas", 10),
                 fg=self.DIM_COLOR,
                 bg=self.TEXT_BG,
                 pady=20,
             )
-            no_sessions.pack()
-        else:
-            for session in self.sessions:
-                self._add_session_item(session)
-
-    def _add_session_item(self, session: SessionInfo) -> None:
-        """Add a session item to the list."""
-        frame = tk.Frame(self.session_frame, bg=self.TEXT_BG, pady=5, padx=10)
-        frame.pack(fill=tk.X, pady=2)
-
-        # Format time
-        created = datetime.fromtimestamp(session["created_at"])
-        time_str = created.strftime("%Y-%m-%d %H:%M")
-
-        # Session info
-        name_label = tk.Label(
-            frame,
-            text=session["name"],
-            font=("Consolas", 10, "bold"),
-            fg=self.TEXT_COLOR,
-            bg=self.TEXT_BG,
-            anchor="w",
+            no_sessions.pack(fill=tk.BOTH, expand=True)
+            return
+
+        # One Treeview for the whole list — rows are drawn on demand, so
+        # opening the dialog stays cheap however many sessions exist
+        style = ttk.Style(self.root)
+        style.theme_use("clam")  # honours custom colours on all platforms
+        style.configure(
+            "Session.Treeview",
+            background=self.TEXT_BG,
+            fieldbackground=self.TEXT_BG,
+            foreground=self.TEXT_COLOR,
+            font=("Consolas", 10),
+            rowheight=30,
+            borderwidth=0,
+        )
+        style.layout("Session.Treeview", [("Treeview.treearea", {"sticky": "nswe"})])
+        style.map(
+            "Session.Treeview",
+            background=[("selected", self.HOVER_BG)],
+            foreground=[("selected", self.TEXT_COLOR)],
         )
-        name_label.pack(fill=tk.X)
 
-        info_text = f"{session['message_count']} messages"
-        info_label = tk.Label(
-            frame,
-            text=info_text,
-            font=("Consolas", 9),
-            fg=self.DIM_COLOR,
-            bg=self.TEXT_BG,
-            anchor="w",
+        self.session_tree = ttk.Treeview(
+            list_frame,
+            columns=("info",),
+            show="tree",
+            selectmode="browse",
+            style="Session.Treeview",
+            cursor="hand2",
+        )
+        self.session_tree.column("#0", stretch=True)
+        self.session_tree.column("info", width=120, stretch=False, anchor="e")
+
+        scrollbar = tk.Scrollbar(
+            list_frame, orient="vertical", command=self.session_tree.yview
         )
-        info_label.pack(fill=tk.X)
-
-        # Make the whole frame clickable
-        for widget in [frame, name_label, info_label]:
-            widget.bind("<Enter>", lambda e, f=frame: f.configure(bg=self.HOVER_BG))
-            widget.bind("<Leave>", lambda e, f=frame: f.configure(bg=self.TEXT_BG))
-            widget.bind("<Button-1>", lambda e, s=session: self._select_session(s))
-
-        # Update child backgrounds on hover
-        for widget in [frame, name_label, info_label]:
-            widget.bind("<Enter>", lambda e, f=frame, n=name_label, i=info_label: (
-                f.configure(bg=self.HOVER_BG),
-                n.configure(bg=self.HOVER_BG),
-                i.configure(bg=self.HOVER_BG),
-            ))
-            widget.bind("<Leave>", lambda e, f=frame, n=name_label, i=info_label: (
-                f.configure(bg=self.TEXT_BG),
-                n.configure(bg=self.TEXT_BG),
-                i.configure(bg=self.TEXT_BG),
-            ))
+        self.session_tree.configure(yscrollcommand=scrollbar.set)
+
+        self.session_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self._sessions_by_iid: dict[str, SessionInfo] = {}
+        for session in self.sessions:
+            iid = str(session["id"])
+            self._sessions_by_iid[iid] = session
+            self.session_tree.insert(
+                "", tk.END,
+                iid=iid,
+                text=session["name"],
+                values=(f"{session['message_count']} messages",),
+            )
+
+        # Hover highlight: one "hover" tag moved between rows, driven by a
+        # single pair of bindings on the tree rather than per-row widgets
+        self.session_tree.tag_configure("hover", background=self.HOVER_BG)
+        self._hover_iid = ""
+        self.session_tree.bind(
+            "<Motion>",
+            lambda e: self._set_hover(self.session_tree.identify_row(e.y)),
+        )
+        self.session_tree.bind("<Leave>", lambda e: self._set_hover(""))
+        # Pick on click or Enter only; <<TreeviewSelect>> also fires on
+        # arrow-key navigation, which must just move the cursor
+        self.session_tree.bind("<ButtonRelease-1>", self._on_tree_click)
+        self.session_tree.bind("<Return>", self._on_tree_return)
+
+    def _set_hover(self, iid: str) -> None:
+        """Move the hover highlight to row ``iid`` ("" clears it)."""
+        if iid == self._hover_iid:
+            return
+        if self._hover_iid:
+            self.session_tree.item(self._hover_iid, tags=())
+        if iid:
+            self.session_tree.item(iid, tags=("hover",))
+        self._hover_iid = iid
+
+    def _on_tree_click(self, event: tk.Event) -> None:
+        """Continue the session whose row was clicked."""
+        self._pick_row(self.session_tree.identify_row(event.y))
+
+    def _on_tree_return(self, event: tk.Event = None) -> None:
+        """Continue the session under the keyboard cursor."""
+        self._pick_row(self.session_tree.focus())
+
+    def _pick_row(self, iid: str) -> None:
+        """Continue the session for row ``iid`` ("" = not on a row)."""
+        session = self._sessions_by_iid.get(iid)
+        if session is not None:
+            self._select_session(session)
 
     def _select_session(self, session: SessionInfo) -> None:
         """Handle session selection."""
@@ -212,11 +242,16 @@ class ChatWindow:
     BUTTON_FG = "#ffffff"
     ACCENT_COLOR = "#4fc3f7"     # Accent for highlights
 
+    MAX_LINES = 5000             # oldest transcript lines are dropped past this
+
     def __init__(self, on_submit: Callable[[str], None], ai_name: str = "Rin"):
         self.on_submit = on_submit
         self.ai_name = ai_name
         self._input_queue: queue.Queue[str] = queue.Queue()
         self._closed = False
+        self.last_activity = time.monotonic()
+        self._pending_chunks: deque[str] = deque()
+        self._flush_scheduled = False
 
         # Create window in main thread
         self.root = tk.Tk()
@@ -234,6 +269,13 @@ class ChatWindow:
         self._setup_fonts()
         self._setup_ui()
 
+        # Track user interaction so the async poller knows when to speed up
+        for sequence in ("<KeyPress>", "<ButtonPress>", "<Motion>", "<MouseWheel>"):
+            self.root.bind_all(sequence, self._mark_activity, add="+")
+
+    def _mark_activity(self, event: tk.Event = None) -> None:
+        self.last_activity = time.monotonic()
+
     def _setup_fonts(self) -> None:
         """Configure fonts."""
         self.chat_font = tkfont.Font(family="Consolas", size=11)
@@ -355,60 +397,82 @@ class ChatWindow:
         if not self._closed:
             self.status_label.config(text=text)
 
+    def _append(self, *segments: str) -> None:
+        """
+        Insert (text, tag, text, tag, ...) segments at the end of the chat.
+
+        Only scrolls to the new text if the view was already at the bottom,
+        so reading back through a long session doesn't force a re-layout
+        down to the end (and a jump) on every update. The transcript is
+        capped at MAX_LINES so a long session can't grow the widget forever.
+        """
+        following = self.chat_display.yview()[1] >= 1.0
+        self.chat_display.config(state=tk.NORMAL)
+        self.chat_display.insert(tk.END, *segments)
+        lines = int(self.chat_display.index("end-1c").split(".")[0])
+        if lines > self.MAX_LINES:
+            self.chat_display.delete("1.0", f"{lines - self.MAX_LINES + 1}.0")
+        self.chat_display.config(state=tk.DISABLED)
+        if following:
+            self.chat_display.see(tk.END)
+
+    def _flush_chunks(self) -> None:
+        """Insert buffered AI chunks in a single redraw."""
+        self._flush_scheduled = False
+        if self._closed or not self._pending_chunks:
+            return
+        text = "".join(self._pending_chunks)
+        self._pending_chunks.clear()
+        self._append(text, "ai")
+
     def append_user_message(self, text: str) -> None:
         """Add a user message to the chat."""
         if self._closed:
             return
-        self.chat_display.config(state=tk.NORMAL)
-        self.chat_display.insert(tk.END, "You: ", "user_name")
-        self.chat_display.insert(tk.END, f"{text}\n\n", "user")
-        self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        self._flush_chunks()
+        self._append("You: ", "user_name", f"{text}\n\n", "user")
 
     def start_ai_message(self) -> None:
         """Start an AI message (shows name prefix)."""
         if self._closed:
             return
-        self.chat_display.config(state=tk.NORMAL)
-        self.chat_display.insert(tk.END, f"{self.ai_name}: ", "ai_name")
-        self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        self._flush_chunks()
+        self._append(f"{self.ai_name}: ", "ai_name")
 
     def append_ai_chunk(self, chunk: str) -> None:
-        """Append a chunk to the current AI message (streaming)."""
+        """
+        Append a chunk to the current AI message (streaming).
+
+        Chunks are buffered and inserted together on a short timer, so a
+        fast token stream costs one redraw per frame rather than per token.
+        """
         if self._closed:
             return
-        self.chat_display.config(state=tk.NORMAL)
-        self.chat_display.insert(tk.END, chunk, "ai")
-        self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        self._pending_chunks.append(chunk)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(_REDRAW_INTERVAL_MS, self._flush_chunks)
 
     def end_ai_message(self) -> None:
         """End the current AI message."""
         if self._closed:
             return
-        self.chat_display.config(state=tk.NORMAL)
-        self.chat_display.insert(tk.END, "\n\n")
-        self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        self._flush_chunks()
+        self._append("\n\n")
 
     def show_error(self, message: str) -> None:
         """Display an error message."""
         if self._closed:
             return
-        self.chat_display.config(state=tk.NORMAL)
-        self.chat_display.insert(tk.END, f"[ERROR] {message}\n\n", "error")
-        self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        self._flush_chunks()
+        self._append(f"[ERROR] {message}\n\n", "error")
 
     def show_info(self, message: str) -> None:
         """Display an info message."""
         if self._closed:
             return
-        self.chat_display.config(state=tk.NORMAL)
-        self.chat_display.insert(tk.END, f"{message}\n", "dim")
-        self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        self._flush_chunks()
+        self._append(f"{message}\n", "dim")
 
     def get_input(self) -> str:
         """Get next user input (blocking)."""
@@ -433,12 +497,15 @@ class AsyncChatWindow:
     def __init__(self, ai_name: str = "Rin"):
         self.ai_name = ai_name
         self._window: ChatWindow | None = None
+        # Submitted text plus any voice input buffered ahead of time. Tk
+        # callbacks run on the event loop thread, so put_nowait() is safe.
         self._input_queue: asyncio.Queue[str] = asyncio.Queue()
-        self._pending_inputs: list[str] = []
+        # Set when a streamed chunk arrives, so an idle pump() wakes for it
+        self._chunk_arrived = asyncio.Event()
 
     def _on_submit(self, text: str) -> None:
         """Callback when user submits text."""
-        self._pending_inputs.append(text)
+        self._input_queue.put_nowait(text)
 
     async def start(self) -> None:
         """Create and show the window."""
@@ -463,6 +530,7 @@ class AsyncChatWindow:
     def append_ai_chunk(self, chunk: str) -> None:
         if self._window:
             self._window.append_ai_chunk(chunk)
+            self._chunk_arrived.set()
 
     def end_ai_message(self) -> None:
         if self._window:
@@ -480,31 +548,82 @@ class AsyncChatWindow:
         """
         Get user input asynchronously.
 
-        Polls the GUI and checks for voice input if STT is provided.
+        Pumps the GUI and, if STT is provided, waits on voice input between
+        pumps so speech is picked up as soon as it is transcribed. The pump
+        runs at ~60fps while the user is interacting and backs off when idle.
         Returns empty string if window is closed.
         """
-        while not self.is_closed:
-            # Update GUI
-            if self._window:
-                self._window.update()
-
-            # Check for pending text input
-            if self._pending_inputs:
-                return self._pending_inputs.pop(0)
-
-            # Check for voice input
-            if stt is not None:
-                try:
-                    voice_text = stt.input_queue.get_nowait()
+        voice_task: asyncio.Task[str] | None = None
+        try:
+            while not self.is_closed:
+                # Update GUI
+                if self._window:
+                    self._window.update()
+
+                # Check for pending text input
+                if not self._input_queue.empty():
+                    return self._input_queue.get_nowait()
+
+                idle = (
+                    self._window is not None
+                    and time.monotonic() - self._window.last_activity > _IDLE_AFTER
+                )
+                interval = _POLL_IDLE if idle else _POLL_ACTIVE
+
+                if stt is None:
+                    await asyncio.sleep(interval)
+                    continue
+
+                # Wait for voice input until the next GUI pump is due
+                if voice_task is None:
+                    voice_task = asyncio.ensure_future(stt.input_queue.get())
+                done, _ = await asyncio.wait({voice_task}, timeout=interval)
+                if done:
+                    voice_text = voice_task.result()
+                    voice_task = None
+                    # Take any utterances queued behind it in the same tick
+                    while True:
+                        try:
+                            queued = stt.input_queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
+                        if queued:
+                            self._input_queue.put_nowait(queued)
                     if voice_text:
                         return voice_text
-                except asyncio.QueueEmpty:
-                    pass
 
-            # Small delay to prevent busy-waiting
-            await asyncio.sleep(0.016)  # ~60fps
+            return ""
+        finally:
+            if voice_task is not None:
+                if voice_task.done() and not voice_task.cancelled():
+                    # Returned text input first — keep the speech for next time
+                    if voice_task.result():
+                        self._input_queue.put_nowait(voice_task.result())
+                else:
+                    voice_task.cancel()
+
+    async def pump(self) -> None:
+        """
+        Keep the GUI responsive until cancelled.
 
-        return ""
+        Wakes when a chunk redraw is due, at ~60fps while the user is
+        interacting, and otherwise only when a new chunk arrives (or every
+        _POLL_IDLE seconds), instead of polling at a fixed frame rate.
+        """
+        while not self.is_closed:
+            self._window.update()
+            if self._window._flush_scheduled:
+                # Buffered chunks go out on the next redraw tick
+                await asyncio.sleep(_REDRAW_INTERVAL_MS / 1000)
+                continue
+            if time.monotonic() - self._window.last_activity <= _IDLE_AFTER:
+                await asyncio.sleep(_POLL_ACTIVE)
+                continue
+            self._chunk_arrived.clear()
+            try:
+                await asyncio.wait_for(self._chunk_arrived.wait(), _POLL_IDLE)
+            except asyncio.TimeoutError:
+                pass
 
     def close(self) -> None:
         """Close the window."""
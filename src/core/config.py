@@ -12,8 +12,9 @@ zero changes to this file.
 
 from __future__ import annotations
 
-import yaml
+import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -22,15 +23,16 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 # ── Subsystem configs ────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """LLM engine + provider configuration."""
     provider: str = "openai_compat"
     max_retries: int = 3
+    warmup: bool = True                   # prime the provider after start()
     provider_config: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSConfig:
     """TTS engine + provider configuration."""
     provider: str = "kokoro"
@@ -38,7 +40,7 @@ class TTSConfig:
     provider_config: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class STTConfig:
     """STT engine + provider configuration."""
     provider: str = "faster_whisper"
@@ -50,27 +52,34 @@ class STTConfig:
     provider_config: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfig:
     path: str = "data/chat_history.db"
     history_limit: int = 20
+    pragmas: dict[str, Any] = field(default_factory=dict)  # overrides ChatDatabase defaults
 
 
-@dataclass
+# Streamed text written to stdout is flushed at most this often (seconds);
+# shared by the terminal UI and the orchestrators' plain-stdout output
+STDOUT_FLUSH_INTERVAL = 0.03
+
+
+@dataclass(slots=True)
 class StreamingConfig:
     min_sentence_chars: int = 12
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonaConfig:
     """Dynamic AI personality configuration."""
     enabled: bool = True
     state_file: str = "src/utils/plugins/dynamic_personality/status.txt"
     update_in_background: bool = True
     context_turns: int = 3  # Number of recent turns to analyze for memory updates
+    update_every_turns: int = 1  # Analyze once per N turns (capped at context_turns)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenshotConfig:
     """Screenshot capture configuration."""
     enabled: bool = False
@@ -78,7 +87,7 @@ class ScreenshotConfig:
     default_monitor: int = 1  # 0 = all monitors, 1 = primary, 2+ = others
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     llm: LLMConfig = field(default_factory=LLMConfig)
     tts: TTSConfig = field(default_factory=TTSConfig)
@@ -92,7 +101,7 @@ class AppConfig:
 # ── Helpers ──────────────────────────────────────────────────────────────
 
 # Engine-level keys for each subsystem — everything else is provider config.
-_LLM_ENGINE_KEYS = {"provider", "max_retries"}
+_LLM_ENGINE_KEYS = {"provider", "max_retries", "warmup"}
 _TTS_ENGINE_KEYS = {"provider", "sample_rate"}
 _STT_ENGINE_KEYS = {
     "provider", "enabled", "sample_rate",
@@ -100,16 +109,38 @@ _STT_ENGINE_KEYS = {
     "vad_threshold",
 }
 
+# Keys resolved against PROJECT_ROOT in addition to any ``*_path`` key.
+_PATH_KEYS = frozenset({"executable"})
+_PATH_SUFFIX = "_path"
+
+
+@lru_cache(maxsize=4)
+def _load_raw(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML file. Cached per (path, mtime) — callers must copy."""
+    # Imported here so modules that only need the dataclasses skip PyYAML
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader   # libyaml C bindings
+    except ImportError:
+        from yaml import SafeLoader
+
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
+
 
 def _resolve_paths(d: dict[str, Any], keys: set[str] | None = None) -> None:
     """Resolve values whose keys look like paths against PROJECT_ROOT."""
-    for key, val in list(d.items()):
-        if isinstance(val, str) and (
-            key.endswith("_path") or key == "executable"
-        ):
-            d[key] = str(PROJECT_ROOT / val)
-        elif isinstance(val, dict):
-            _resolve_paths(val)
+    # Walk nested dicts with an explicit stack. Only existing keys are
+    # reassigned, so iterating the live items() view is safe.
+    stack = [d]
+    while stack:
+        node = stack.pop()
+        for key, val in node.items():
+            if isinstance(val, str):
+                if key in _PATH_KEYS or key.endswith(_PATH_SUFFIX):
+                    node[key] = str(PROJECT_ROOT / val)
+            elif isinstance(val, dict):
+                stack.append(val)
 
 
 def _split_section(
@@ -131,11 +162,13 @@ def load_config(path: Path | None = None) -> AppConfig:
     config_path = path or PROJECT_ROOT / "config.yaml"
     cfg = AppConfig()
 
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return cfg
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+    # Sections are resolved in place below, so work on a copy of the cache
+    raw = copy.deepcopy(_load_raw(str(config_path), mtime_ns))
 
     # ── LLM ──────────────────────────────────────────────────────
     if "llm" in raw:
@@ -7,8 +7,11 @@ Hides all logging output from the terminal.
 
 from __future__ import annotations
 
+import asyncio
 import sys
 
+from src.core.config import STDOUT_FLUSH_INTERVAL
+
 # ANSI color codes
 class Colors:
     RESET = "\033[0m"
@@ -30,12 +33,41 @@ class Colors:
     BRIGHT_GREEN = "\033[92m"
 
 
+# Static screen blocks — each is emitted with a single write
+_HEADER = (
+    "\n"
+    f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}╔══════════════════════════════════════════════════════════╗{Colors.RESET}\n"
+    f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}║{Colors.RESET}          {Colors.BRIGHT_CYAN}✨ Project Rin — Local AI Voice Agent ✨{Colors.RESET}          {Colors.BRIGHT_MAGENTA}{Colors.BOLD}║{Colors.RESET}\n"
+    f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}╚══════════════════════════════════════════════════════════╝{Colors.RESET}\n"
+    "\n"
+)
+
+_STATUS_FOOTER = (
+    f"  {Colors.DIM}Type {Colors.WHITE}\"quit\"{Colors.DIM} or press {Colors.WHITE}Ctrl+C{Colors.DIM} to exit{Colors.RESET}\n"
+    "\n"
+    f"{Colors.DIM}{'─' * 60}{Colors.RESET}\n"
+    "\n"
+)
+_STATUS_VOICE = (
+    f"  {Colors.GREEN}●{Colors.RESET} {Colors.DIM}Voice input enabled — speak or type{Colors.RESET}\n"
+    + _STATUS_FOOTER
+)
+_STATUS_TEXT = (
+    f"  {Colors.YELLOW}○{Colors.RESET} {Colors.DIM}Type your message and press Enter{Colors.RESET}\n"
+    + _STATUS_FOOTER
+)
+
+
 class TerminalUI:
     """Clean terminal interface for chat."""
 
     def __init__(self, user_name: str = "You", ai_name: str = "Rin"):
         self.user_name = user_name
         self.ai_name = ai_name
+        # Speaker labels never change, so build the coloured strings once
+        self._user_prefix = f"{Colors.BRIGHT_CYAN}{Colors.BOLD}{user_name}:{Colors.RESET} "
+        self._ai_prefix = f"\n{Colors.BRIGHT_MAGENTA}{Colors.BOLD}{ai_name}:{Colors.RESET} "
+        self._flush_pending = False
         self._enable_colors()
 
     def _enable_colors(self) -> None:
@@ -51,46 +83,55 @@ class TerminalUI:
 
     def print_header(self) -> None:
         """Print the app header."""
-        print()
-        print(f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}╔══════════════════════════════════════════════════════════╗{Colors.RESET}")
-        print(f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}║{Colors.RESET}          {Colors.BRIGHT_CYAN}✨ Project Rin — Local AI Voice Agent ✨{Colors.RESET}          {Colors.BRIGHT_MAGENTA}{Colors.BOLD}║{Colors.RESET}")
-        print(f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}╚══════════════════════════════════════════════════════════╝{Colors.RESET}")
-        print()
+        sys.stdout.write(_HEADER)
+        sys.stdout.flush()
 
     def print_status(self, stt_enabled: bool) -> None:
         """Print status info."""
-        if stt_enabled:
-            print(f"  {Colors.GREEN}●{Colors.RESET} {Colors.DIM}Voice input enabled — speak or type{Colors.RESET}")
-        else:
-            print(f"  {Colors.YELLOW}○{Colors.RESET} {Colors.DIM}Type your message and press Enter{Colors.RESET}")
-        print(f"  {Colors.DIM}Type {Colors.WHITE}\"quit\"{Colors.DIM} or press {Colors.WHITE}Ctrl+C{Colors.DIM} to exit{Colors.RESET}")
-        print()
-        print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
-        print()
+        sys.stdout.write(_STATUS_VOICE if stt_enabled else _STATUS_TEXT)
+        sys.stdout.flush()
 
     def print_user_prompt(self) -> str:
         """Print user prompt and get input."""
         try:
-            return input(f"{Colors.BRIGHT_CYAN}{Colors.BOLD}{self.user_name}:{Colors.RESET} ")
+            return input(self._user_prefix)
         except EOFError:
             return ""
 
     def print_user_message(self, text: str) -> None:
         """Print a user message (for STT transcriptions)."""
-        print(f"{Colors.BRIGHT_CYAN}{Colors.BOLD}{self.user_name}:{Colors.RESET} {text}")
+        print(self._user_prefix + text)
 
     def start_ai_response(self) -> None:
         """Print AI name prefix before streaming."""
-        print(f"\n{Colors.BRIGHT_MAGENTA}{Colors.BOLD}{self.ai_name}:{Colors.RESET} ", end="", flush=True)
+        print(self._ai_prefix, end="", flush=True)
 
     def print_ai_chunk(self, chunk: str) -> None:
-        """Print a chunk of AI response (streaming)."""
-        print(f"{Colors.WHITE}{chunk}{Colors.RESET}", end="", flush=True)
+        """
+        Print a chunk of AI response (streaming).
+
+        Writes are buffered and flushed on a short timer, so a fast token
+        stream costs one terminal write per ~30ms rather than one per token.
+        """
+        sys.stdout.write(Colors.WHITE + chunk + Colors.RESET)
+        if self._flush_pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # called outside the event loop
+            sys.stdout.flush()
+            return
+        self._flush_pending = True
+        loop.call_later(STDOUT_FLUSH_INTERVAL, self._flush_chunks)
+
+    def _flush_chunks(self) -> None:
+        self._flush_pending = False
+        sys.stdout.flush()
 
     def end_ai_response(self) -> None:
         """End AI response line."""
         print()
-        print()
+        print(flush=True)
 
     def print_error(self, message: str) -> None:
         """Print an error message."""
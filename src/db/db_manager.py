@@ -1,21 +1,39 @@
 """
 Async SQLite database for persisting chat history with session support.
 
-Each session stores messages as a JSON array, allowing users to continue
-previous conversations or start fresh.
+Messages live in their own table, one row per message, keyed by session
+and position, allowing users to continue previous conversations or start
+fresh. Databases from the older layout (a JSON array per session) are
+migrated on first open.
 """
 
 from __future__ import annotations
 
 import aiosqlite
+import asyncio
 import json
+import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import TypedDict
+from typing import Sequence, TypedDict
 
 from src.core.config import AppConfig
 
+log = logging.getLogger(__name__)
+
+# Applied on every connection. WAL + synchronous=NORMAL means a commit no
+# longer waits for an fsync (only checkpoints do), which is what made each
+# save slow; the rest keep hot pages and temp data in memory.
+_DEFAULT_PRAGMAS: dict[str, object] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,
+    "cache_size": -65536,
+    "busy_timeout": 3000,
+}
+
 
 class Message(TypedDict):
     """Single message in a session."""
@@ -39,24 +57,81 @@ class ChatDatabase:
     def __init__(self, config: AppConfig) -> None:
         self._db_path = config.database.path
         self._history_limit = config.database.history_limit
+        self._pragmas = {**_DEFAULT_PRAGMAS, **config.database.pragmas}
         self._db: aiosqlite.Connection | None = None
         self._current_session_id: int | None = None
+        # Sessions are never renamed, so the name is cached on load/create
+        self._current_session_name: str | None = None
+        # Background writes — serialized so read-modify-write saves don't race
+        self._write_lock = asyncio.Lock()
+        self._pending_writes: set[asyncio.Task] = set()
 
     async def initialize(self) -> None:
         """Create the database and tables if they don't exist."""
         Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
         self._db = await aiosqlite.connect(self._db_path)
+        for name, value in self._pragmas.items():
+            if value is None:
+                continue
+            if not name.isidentifier():
+                raise ValueError(f"Invalid SQLite pragma name: {name!r}")
+            await self._db.execute(f"PRAGMA {name}={value}")
         await self._db.execute("""
             CREATE TABLE IF NOT EXISTS sessions (
-                id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                name        TEXT    NOT NULL,
-                messages    TEXT    NOT NULL DEFAULT '[]',
-                created_at  REAL    NOT NULL,
-                updated_at  REAL    NOT NULL
+                id             INTEGER PRIMARY KEY AUTOINCREMENT,
+                name           TEXT    NOT NULL,
+                message_count  INTEGER NOT NULL DEFAULT 0,
+                created_at     REAL    NOT NULL,
+                updated_at     REAL    NOT NULL
             )
         """)
+        await self._db.execute("""
+            CREATE TABLE IF NOT EXISTS messages (
+                session_id  INTEGER NOT NULL REFERENCES sessions(id),
+                seq         INTEGER NOT NULL,
+                role        TEXT    NOT NULL,
+                content     TEXT    NOT NULL,
+                time        REAL    NOT NULL,
+                PRIMARY KEY (session_id, seq)
+            ) WITHOUT ROWID
+        """)
+        await self._migrate_json_messages()
         await self._db.commit()
 
+    async def _migrate_json_messages(self) -> None:
+        """Move messages out of the old per-session JSON column, if present."""
+        cursor = await self._db.execute("PRAGMA table_info(sessions)")
+        columns = {row[1] for row in await cursor.fetchall()}
+        if "messages" not in columns:
+            return
+
+        if "message_count" not in columns:
+            await self._db.execute(
+                "ALTER TABLE sessions ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0"
+            )
+
+        cursor = await self._db.execute(
+            "SELECT id, messages FROM sessions WHERE messages != '[]'"
+        )
+        rows = await cursor.fetchall()
+        for session_id, blob in rows:
+            messages: list[Message] = json.loads(blob)
+            await self._db.executemany(
+                "INSERT OR IGNORE INTO messages (session_id, seq, role, content, time) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (session_id, seq, m["role"], m["content"], m.get("time", 0.0))
+                    for seq, m in enumerate(messages, start=1)
+                ],
+            )
+            # The old column stays (older SQLite can't drop it) but is emptied
+            await self._db.execute(
+                "UPDATE sessions SET messages = '[]', message_count = ? WHERE id = ?",
+                (len(messages), session_id),
+            )
+        if rows:
+            log.info("Migrated %d session(s) to the messages table", len(rows))
+
     async def create_session(self, name: str | None = None) -> int:
         """Create a new session and return its ID."""
         if self._db is None:
@@ -67,11 +142,12 @@ class ChatDatabase:
             name = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         cursor = await self._db.execute(
-            "INSERT INTO sessions (name, messages, created_at, updated_at) VALUES (?, ?, ?, ?)",
-            (name, "[]", now, now),
+            "INSERT INTO sessions (name, created_at, updated_at) VALUES (?, ?, ?)",
+            (name, now, now),
         )
         await self._db.commit()
         self._current_session_id = cursor.lastrowid
+        self._current_session_name = name
         return self._current_session_id
 
     async def load_session(self, session_id: int) -> bool:
@@ -79,13 +155,15 @@ class ChatDatabase:
         if self._db is None:
             raise RuntimeError("Database not initialized — call initialize() first")
 
-        cursor = await self._db.execute(
-            "SELECT id FROM sessions WHERE id = ?",
+        # Existence check and name lookup in one primary-key probe
+        async with self._db.execute(
+            "SELECT name FROM sessions WHERE id = ?",
             (session_id,),
-        )
-        row = await cursor.fetchone()
+        ) as cursor:
+            row = await cursor.fetchone()
         if row:
             self._current_session_id = session_id
+            self._current_session_name = row[0]
             return True
         return False
 
@@ -96,7 +174,7 @@ class ChatDatabase:
 
         cursor = await self._db.execute(
             """
-            SELECT id, name, messages, created_at, updated_at
+            SELECT id, name, message_count, created_at, updated_at
             FROM sessions
             ORDER BY updated_at DESC
             LIMIT ?
@@ -105,46 +183,95 @@ class ChatDatabase:
         )
         rows = await cursor.fetchall()
 
-        sessions: list[SessionInfo] = []
-        for row in rows:
-            messages = json.loads(row[2])
-            sessions.append({
+        return [
+            {
                 "id": row[0],
                 "name": row[1],
-                "message_count": len(messages),
+                "message_count": row[2],
                 "created_at": row[3],
                 "updated_at": row[4],
-            })
-        return sessions
+            }
+            for row in rows
+        ]
 
     async def save_message(self, role: str, content: str) -> None:
         """Persist a single message to the current session."""
+        await self.save_messages([(role, content)])
+
+    async def save_messages(
+        self,
+        messages: Sequence[tuple[str, str]],
+        session_id: int | None = None,
+    ) -> None:
+        """
+        Persist ``(role, content)`` messages to a session, in order.
+
+        *session_id* defaults to the current session. All of them go in one
+        transaction with a single commit, so saving a whole turn costs one
+        write instead of one per message.
+        """
         if self._db is None:
             raise RuntimeError("Database not initialized — call initialize() first")
-        if self._current_session_id is None:
+        if session_id is None:
+            session_id = self._current_session_id
+        if session_id is None:
             raise RuntimeError("No session loaded — call create_session() or load_session() first")
+        if not messages:
+            return
 
-        # Get current messages
-        cursor = await self._db.execute(
-            "SELECT messages FROM sessions WHERE id = ?",
-            (self._current_session_id,),
-        )
-        row = await cursor.fetchone()
-        messages: list[Message] = json.loads(row[0]) if row else []
-
-        # Append new message
-        messages.append({
-            "role": role,
-            "content": content,
-            "time": time.time(),
-        })
-
-        # Update session
-        await self._db.execute(
-            "UPDATE sessions SET messages = ?, updated_at = ? WHERE id = ?",
-            (json.dumps(messages), time.time(), self._current_session_id),
+        async with self._write_lock:
+            now = time.time()
+            # Append after the session's current last message
+            await self._db.executemany(
+                """
+                INSERT INTO messages (session_id, seq, role, content, time)
+                SELECT id, message_count + ?, ?, ?, ? FROM sessions WHERE id = ?
+                """,
+                [
+                    (offset, role, content, now, session_id)
+                    for offset, (role, content) in enumerate(messages, start=1)
+                ],
+            )
+            await self._db.execute(
+                "UPDATE sessions SET message_count = message_count + ?, updated_at = ? WHERE id = ?",
+                (len(messages), now, session_id),
+            )
+            await self._db.commit()
+
+    def save_message_background(self, role: str, content: str) -> None:
+        """Persist a single message without waiting for the commit."""
+        self.save_messages_background([(role, content)])
+
+    def save_messages_background(self, messages: Sequence[tuple[str, str]]) -> None:
+        """
+        Persist messages without waiting for the commit.
+
+        Writes run in the order they were scheduled, into the session that
+        was current when they were scheduled (even if another one is loaded
+        before they run); ``flush()`` (and ``close()``) wait for any that
+        are still pending.
+        """
+        task = asyncio.create_task(
+            self._save_messages_logged(list(messages), self._current_session_id)
         )
-        await self._db.commit()
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+
+    async def _save_messages_logged(
+        self, messages: list[tuple[str, str]], session_id: int | None
+    ) -> None:
+        try:
+            await self.save_messages(messages, session_id)
+        except Exception as e:
+            log.error(
+                "Failed to save %s message(s): %s",
+                "/".join(role for role, _ in messages), e,
+            )
+
+    async def flush(self) -> None:
+        """Wait for all background writes to finish."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes)
 
     async def get_history(self, limit: int | None = None) -> list[dict[str, str]]:
         """Return the last *limit* messages as OpenAI-style dicts."""
@@ -153,35 +280,33 @@ class ChatDatabase:
         if self._current_session_id is None:
             return []
 
+        # Make sure background saves are visible to this read
+        await self.flush()
+
         limit = limit or self._history_limit
 
+        # Newest `limit` messages (all if no limit), returned oldest first
         cursor = await self._db.execute(
-            "SELECT messages FROM sessions WHERE id = ?",
-            (self._current_session_id,),
+            """
+            SELECT role, content FROM messages
+            WHERE session_id = ?
+            ORDER BY seq DESC
+            LIMIT ?
+            """,
+            (self._current_session_id, limit or -1),
         )
-        row = await cursor.fetchone()
-        if not row:
-            return []
-
-        messages: list[Message] = json.loads(row[0])
-        # Return last `limit` messages in OpenAI format
-        recent = messages[-limit:] if limit else messages
-        return [{"role": m["role"], "content": m["content"]} for m in recent]
+        rows = await cursor.fetchall()
+        return [{"role": role, "content": content} for role, content in reversed(rows)]
 
     async def get_session_name(self) -> str | None:
         """Get the current session's name."""
         if self._db is None or self._current_session_id is None:
             return None
-
-        cursor = await self._db.execute(
-            "SELECT name FROM sessions WHERE id = ?",
-            (self._current_session_id,),
-        )
-        row = await cursor.fetchone()
-        return row[0] if row else None
+        return self._current_session_name
 
     async def close(self) -> None:
         """Cleanly close the database connection."""
+        await self.flush()
         if self._db:
             await self._db.close()
             self._db = None
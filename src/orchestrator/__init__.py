@@ -1 +1 @@
-# Orchestrator — LangGraph-based pipeline coordination
+# Orchestrator — pipeline coordination
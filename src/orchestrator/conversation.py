@@ -12,14 +12,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 import time
-from typing import TYPE_CHECKING
+from collections import deque
+from contextlib import aclosing, suppress
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Protocol
 
 from src.service.llm.engine import LLMEngine
-from src.service.tts.engine import TTSEngine, extract_sentences
+from src.service.tts.engine import (
+    SENTENCE_TERMINATORS,
+    TTSEngine,
+    extract_sentences,
+)
 from src.db.db_manager import ChatDatabase
-from src.core.config import AppConfig
+from src.core.config import STDOUT_FLUSH_INTERVAL, AppConfig
 from src.utils.plugins.dynamic_personality import (
+    MemoryUpdateWorker,
     StatusManager,
     update_memory_background,
 )
@@ -30,6 +38,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Background memory updates run one at a time, batched, newest request wins
+_memory_updates = MemoryUpdateWorker()
+
 
 def _build_memory_context(status: StatusManager | None) -> str | None:
     """Build the memory context to inject into system prompt."""
@@ -43,190 +54,274 @@ def _build_memory_context(status: StatusManager | None) -> str | None:
     return memory_block or None
 
 
-async def run_turn_with_window(
-    user_input: str,
-    llm: LLMEngine,
-    tts: TTSEngine,
+async def _run_until_first_error(*coros) -> None:
+    """
+    Run *coros* concurrently, cancelling the others as soon as one fails.
+
+    Unlike ``asyncio.gather``, an error in TTS playback stops the LLM stream
+    immediately instead of surfacing only after the whole reply has streamed.
+    """
+    tasks = [asyncio.create_task(c) for c in coros]
+    try:
+        done, pending = await asyncio.wait(
+            tasks, return_when=asyncio.FIRST_EXCEPTION
+        )
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    for task in done:
+        task.result()  # re-raise the first failure, if any
+
+
+async def _prompt_history(
     db: ChatDatabase,
     config: AppConfig,
-    window: AsyncChatWindow,
-    status: StatusManager | None = None,
-) -> str:
+    history: list[dict[str, str]] | None,
+    user_input: str,
+) -> list[dict[str, str]]:
     """
-    Run one conversation turn with GUI window output.
+    Return the messages to send for this turn, ending with the user input.
 
-    Streams LLM tokens while concurrently playing TTS for finished sentences.
-    A third task keeps the GUI responsive during playback.
-    Memory is updated via background LLM call after the turn.
+    Uses the caller's cached *history* when given, otherwise reads it from
+    the database.
     """
-    history = await db.get_history()
+    if history is None:
+        history = await db.get_history()
+    else:
+        history = history[-config.database.history_limit:]
+    return [*history, {"role": "user", "content": user_input}]
+
+
+def _remember_turn(
+    history: list[dict[str, str]] | None,
+    user_input: str,
+    full_reply: str,
+    limit: int,
+) -> None:
+    """Append the finished exchange to the cached history, keeping *limit* messages."""
+    if history is None:
+        return
     history.append({"role": "user", "content": user_input})
+    history.append({"role": "assistant", "content": full_reply})
+    if limit and len(history) > limit:
+        del history[:-limit]
 
-    # Build memory context for LLM
-    memory_context = _build_memory_context(status)
-    if memory_context:
-        log.info("[MEMORY] Injecting %d chars into system prompt", len(memory_context))
 
-    sentence_queue: asyncio.Queue[str | None] = asyncio.Queue()
-    full_reply_parts: list[str] = []
-    turn_done = asyncio.Event()
+# ── output sinks ─────────────────────────────────────────────────────
 
-    async def _stream_llm() -> None:
-        buffer = ""
-        try:
-            async for chunk in llm.generate_response(
-                history,
-                max_retries=config.llm.max_retries,
-                memory_context=memory_context,
-            ):
-                full_reply_parts.append(chunk)
-                window.append_ai_chunk(chunk)
-                buffer += chunk
-
-                sentences, buffer = extract_sentences(
-                    buffer, config.streaming.min_sentence_chars
-                )
-                for sentence in sentences:
-                    await sentence_queue.put(sentence)
-        except Exception as e:
-            log.error("LLM stream error: %s", e)
-            window.show_error(f"LLM error: {e}")
+class OutputSink(Protocol):
+    """Where a turn's streamed reply is shown."""
 
-        leftover = buffer.strip()
-        if leftover:
-            await sentence_queue.put(leftover)
-        await sentence_queue.put(None)
+    def start(self) -> None: ...
+    def append_chunk(self, chunk: str) -> None: ...
+    def end(self) -> None: ...
+    def error(self, message: str) -> None: ...
 
-    async def _speak_sentences() -> None:
-        while True:
-            sentence = await sentence_queue.get()
-            if sentence is None:
-                break
-            await tts.speak(sentence)
 
-    async def _update_gui() -> None:
-        """Keep GUI responsive while LLM streams and TTS plays."""
-        while not turn_done.is_set():
-            if window._window and not window._window.is_closed:
-                window._window.update()
-            await asyncio.sleep(0.016)  # ~60fps
+class _WindowSink:
+    __slots__ = ("_window",)
 
-    t0 = time.perf_counter()
+    def __init__(self, window: AsyncChatWindow) -> None:
+        self._window = window
 
-    window.start_ai_message()
+    def start(self) -> None:
+        self._window.start_ai_message()
 
-    # Run LLM streaming, TTS playback, and GUI updates concurrently
-    gui_task = asyncio.create_task(_update_gui())
-    try:
-        await asyncio.gather(_stream_llm(), _speak_sentences())
-    finally:
-        turn_done.set()
-        await gui_task
+    def append_chunk(self, chunk: str) -> None:
+        self._window.append_ai_chunk(chunk)
 
-    window.end_ai_message()
+    def end(self) -> None:
+        self._window.end_ai_message()
 
-    elapsed = time.perf_counter() - t0
-    full_reply = "".join(full_reply_parts)
+    def error(self, message: str) -> None:
+        self._window.show_error(message)
 
-    log.info("Turn complete in %.2fs | reply=%r", elapsed, full_reply[:100])
 
-    # Persist messages to database
-    await db.save_message("user", user_input)
-    await db.save_message("assistant", full_reply)
+class _TerminalSink:
+    __slots__ = ("_ui",)
 
-    # Update memory in background (non-blocking)
-    if status and config.persona.enabled:
-        # Get recent turns for memory context (x2 for user+assistant pairs)
-        recent = await db.get_history(config.persona.context_turns * 2)
-        if config.persona.update_in_background:
-            asyncio.create_task(
-                update_memory_background(recent, status, llm)
+    def __init__(self, ui: TerminalUI) -> None:
+        self._ui = ui
+
+    def start(self) -> None:
+        self._ui.start_ai_response()
+
+    def append_chunk(self, chunk: str) -> None:
+        self._ui.print_ai_chunk(chunk)
+
+    def end(self) -> None:
+        self._ui.end_ai_response()
+
+    def error(self, message: str) -> None:
+        self._ui.print_error(message)
+
+
+class _StdoutSink:
+    __slots__ = ("_flush_pending",)
+
+    def __init__(self) -> None:
+        self._flush_pending = False
+
+    def start(self) -> None:
+        print("\nRin: ", end="", flush=True)
+
+    def append_chunk(self, chunk: str) -> None:
+        # Buffered; flushed on a short timer rather than once per token
+        sys.stdout.write(chunk)
+        if not self._flush_pending:
+            self._flush_pending = True
+            asyncio.get_running_loop().call_later(
+                STDOUT_FLUSH_INTERVAL, self._flush,
             )
-        else:
-            await update_memory_background(recent, status, llm)
 
-    return full_reply
+    def _flush(self) -> None:
+        self._flush_pending = False
+        sys.stdout.flush()
 
+    def end(self) -> None:
+        print(flush=True)
 
-async def run_turn_with_ui(
+    def error(self, message: str) -> None:
+        print(f"\n[{message}]")
+
+
+# ── turns ────────────────────────────────────────────────────────────
+
+async def _run_turn(
     user_input: str,
     llm: LLMEngine,
     tts: TTSEngine,
     db: ChatDatabase,
     config: AppConfig,
-    ui: TerminalUI,
-    status: StatusManager | None = None,
+    sink: OutputSink,
+    status: StatusManager | None,
+    history: list[dict[str, str]] | None,
+    pump: Callable[[], Awaitable[None]] | None = None,
 ) -> str:
     """
-    Run one conversation turn with terminal UI output.
+    Run one conversation turn, streaming the reply to *sink*.
 
     Streams LLM tokens while concurrently playing TTS for finished sentences.
+    If *pump* is given it runs alongside them (e.g. to keep a GUI responsive)
+    and is cancelled when the reply is done.
     Memory is updated via background LLM call after the turn.
     """
-    history = await db.get_history()
-    history.append({"role": "user", "content": user_input})
+    messages = await _prompt_history(db, config, history, user_input)
 
     # Build memory context for LLM
     memory_context = _build_memory_context(status)
+    if memory_context:
+        log.info("[MEMORY] Injecting %d chars into system prompt", len(memory_context))
 
-    sentence_queue: asyncio.Queue[str | None] = asyncio.Queue()
+    # Single producer/consumer in one loop — a deque + event is all we need
+    pending_sentences: deque[str | None] = deque()
+    sentence_ready = asyncio.Event()
     full_reply_parts: list[str] = []
 
     async def _stream_llm() -> None:
-        buffer = ""
+        min_chars = config.streaming.min_sentence_chars
+        append_chunk = sink.append_chunk
+        buffer_parts: list[str] = []
+        buffered_chars = 0
+        pending_end = False
         try:
-            async for chunk in llm.generate_response(
-                history,
+            async with aclosing(llm.generate_response(
+                messages,
                 max_retries=config.llm.max_retries,
                 memory_context=memory_context,
-            ):
-                full_reply_parts.append(chunk)
-                ui.print_ai_chunk(chunk)
-                buffer += chunk
-
-                sentences, buffer = extract_sentences(
-                    buffer, config.streaming.min_sentence_chars
-                )
-                for sentence in sentences:
-                    await sentence_queue.put(sentence)
+            )) as chunks:
+                async for chunk in chunks:
+                    full_reply_parts.append(chunk)
+                    append_chunk(chunk)
+                    buffer_parts.append(chunk)
+                    buffered_chars += len(chunk)
+
+                    # Only re-scan when a sentence boundary could have formed and
+                    # the buffer is long enough to hold a full sentence
+                    if buffered_chars < min_chars or (
+                        not pending_end and SENTENCE_TERMINATORS.isdisjoint(chunk)
+                    ):
+                        pending_end = chunk[-1:] in SENTENCE_TERMINATORS
+                        continue
+                    sentences, buffer = extract_sentences(
+                        "".join(buffer_parts), min_chars
+                    )
+                    buffer_parts = [buffer]
+                    buffered_chars = len(buffer)
+                    pending_end = buffer[-1:] in SENTENCE_TERMINATORS
+                    for sentence in sentences:
+                        pending_sentences.append(sentence)
+                        sentence_ready.set()
         except Exception as e:
             log.error("LLM stream error: %s", e)
-            ui.print_error(f"LLM error: {e}")
+            sink.error(f"LLM error: {e}")
 
-        leftover = buffer.strip()
+        leftover = "".join(buffer_parts).strip()
         if leftover:
-            await sentence_queue.put(leftover)
-        await sentence_queue.put(None)
+            pending_sentences.append(leftover)
+        pending_sentences.append(None)
+        sentence_ready.set()
 
-    async def _speak_sentences() -> None:
+    async def _next_sentences() -> AsyncIterator[str]:
         while True:
-            sentence = await sentence_queue.get()
+            if not pending_sentences:
+                sentence_ready.clear()
+                await sentence_ready.wait()
+            sentence = pending_sentences.popleft()
             if sentence is None:
-                break
-            await tts.speak(sentence)
+                return
+            yield sentence
+
+    async def _speak_sentences() -> None:
+        # Synthesizes the next sentence while the current one plays
+        await tts.speak_stream(_next_sentences())
 
     t0 = time.perf_counter()
 
-    ui.start_ai_response()
-    await asyncio.gather(_stream_llm(), _speak_sentences())
-    ui.end_ai_response()
+    sink.start()
+
+    # Run LLM streaming, TTS playback, and the pump (if any) concurrently
+    pump_task = asyncio.create_task(pump()) if pump is not None else None
+    try:
+        await _run_until_first_error(_stream_llm(), _speak_sentences())
+    finally:
+        if pump_task is not None:
+            pump_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await pump_task
+
+    sink.end()
 
     elapsed = time.perf_counter() - t0
     full_reply = "".join(full_reply_parts)
 
     log.info("Turn complete in %.2fs | reply=%r", elapsed, full_reply[:100])
 
-    # Persist messages to database
-    await db.save_message("user", user_input)
-    await db.save_message("assistant", full_reply)
+    # Persist messages in the background so the next prompt isn't blocked
+    db.save_messages_background([("user", user_input), ("assistant", full_reply)])
+    _remember_turn(history, user_input, full_reply, config.database.history_limit)
 
     # Update memory in background (non-blocking)
     if status and config.persona.enabled:
-        # Get recent turns for memory context (x2 for user+assistant pairs)
-        recent = await db.get_history(config.persona.context_turns * 2)
+        # Recent turns for memory context (x2 for user+assistant pairs),
+        # taken from the prompt we just sent when it reaches back far enough
+        wanted = config.persona.context_turns * 2
+        limit = config.database.history_limit
+        if not limit or wanted <= limit + 2:
+            recent = [*messages, {"role": "assistant", "content": full_reply}][-wanted:]
+        else:
+            # get_history() waits for the background save above first
+            recent = await db.get_history(wanted)
         if config.persona.update_in_background:
-            asyncio.create_task(
-                update_memory_background(recent, status, llm)
+            # One analysis can cover as many turns as its window holds
+            batch = min(config.persona.update_every_turns, config.persona.context_turns)
+            _memory_updates.submit(
+                recent, status, llm, batch=batch, window=config.persona.context_turns
             )
         else:
             await update_memory_background(recent, status, llm)
@@ -234,85 +329,63 @@ async def run_turn_with_ui(
     return full_reply
 
 
-async def run_turn(
+async def close_memory_updates() -> None:
+    """Finish pending background memory updates, bounded (call on shutdown)."""
+    await _memory_updates.close()
+
+
+async def run_turn_with_window(
     user_input: str,
     llm: LLMEngine,
     tts: TTSEngine,
     db: ChatDatabase,
     config: AppConfig,
+    window: AsyncChatWindow,
     status: StatusManager | None = None,
+    history: list[dict[str, str]] | None = None,
 ) -> str:
     """
-    Run one conversation turn (plain output, no UI).
+    Run one conversation turn with GUI window output.
 
-    For backwards compatibility or headless use.
+    The window is pumped during the turn, waking only when there is
+    something to draw.
     """
-    history = await db.get_history()
-    history.append({"role": "user", "content": user_input})
-
-    # Build memory context for LLM
-    memory_context = _build_memory_context(status)
-
-    sentence_queue: asyncio.Queue[str | None] = asyncio.Queue()
-    full_reply_parts: list[str] = []
+    return await _run_turn(
+        user_input, llm, tts, db, config, _WindowSink(window), status, history,
+        pump=window.pump,
+    )
 
-    async def _stream_llm() -> None:
-        buffer = ""
-        try:
-            async for chunk in llm.generate_response(
-                history,
-                max_retries=config.llm.max_retries,
-                memory_context=memory_context,
-            ):
-                full_reply_parts.append(chunk)
-                print(chunk, end="", flush=True)
-                buffer += chunk
-
-                sentences, buffer = extract_sentences(
-                    buffer, config.streaming.min_sentence_chars
-                )
-                for sentence in sentences:
-                    await sentence_queue.put(sentence)
-        except Exception as e:
-            log.error("LLM stream error: %s", e)
-            print(f"\n[LLM ERROR] {e}")
-
-        leftover = buffer.strip()
-        if leftover:
-            await sentence_queue.put(leftover)
-        await sentence_queue.put(None)
-
-    async def _speak_sentences() -> None:
-        while True:
-            sentence = await sentence_queue.get()
-            if sentence is None:
-                break
-            await tts.speak(sentence)
-
-    t0 = time.perf_counter()
 
-    print("\nRin: ", end="", flush=True)
-    await asyncio.gather(_stream_llm(), _speak_sentences())
-    print()
-
-    elapsed = time.perf_counter() - t0
-    full_reply = "".join(full_reply_parts)
-
-    log.info("Turn complete in %.2fs | reply=%r", elapsed, full_reply[:100])
+async def run_turn_with_ui(
+    user_input: str,
+    llm: LLMEngine,
+    tts: TTSEngine,
+    db: ChatDatabase,
+    config: AppConfig,
+    ui: TerminalUI,
+    status: StatusManager | None = None,
+    history: list[dict[str, str]] | None = None,
+) -> str:
+    """Run one conversation turn with terminal UI output."""
+    return await _run_turn(
+        user_input, llm, tts, db, config, _TerminalSink(ui), status, history,
+    )
 
-    # Persist messages to database
-    await db.save_message("user", user_input)
-    await db.save_message("assistant", full_reply)
 
-    # Update memory in background (non-blocking)
-    if status and config.persona.enabled:
-        # Get recent turns for memory context (x2 for user+assistant pairs)
-        recent = await db.get_history(config.persona.context_turns * 2)
-        if config.persona.update_in_background:
-            asyncio.create_task(
-                update_memory_background(recent, status, llm)
-            )
-        else:
-            await update_memory_background(recent, status, llm)
+async def run_turn(
+    user_input: str,
+    llm: LLMEngine,
+    tts: TTSEngine,
+    db: ChatDatabase,
+    config: AppConfig,
+    status: StatusManager | None = None,
+    history: list[dict[str, str]] | None = None,
+) -> str:
+    """
+    Run one conversation turn (plain output, no UI).
 
-    return full_reply
+    For backwards compatibility or headless use.
+    """
+    return await _run_turn(
+        user_input, llm, tts, db, config, _StdoutSink(), status, history,
+    )
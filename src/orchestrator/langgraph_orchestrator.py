@@ -1,5 +1,5 @@
 """
-LangGraph-based LLM pipeline orchestrator.
+LLM pipeline orchestrator.
 
 This module handles ONLY the LLM streaming pipeline:
   - Fetch chat history
@@ -8,23 +8,25 @@ This module handles ONLY the LLM streaming pipeline:
 Other concerns (TTS playback, DB persistence) are handled by the caller
 in conversation.py, which consumes sentences from the async generator.
 
-Graph structure:
-    START -> stream_llm -> END
+Pipeline:
+    fetch_history -> stream_llm
+
+The stages are plain coroutines run in order; each returns the state
+keys it updates, which are merged into the state dict.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 import time
-from typing import Any, TypedDict
-
-from langchain_core.runnables import RunnableConfig
-from langgraph.graph import StateGraph, START, END
+from typing import TypedDict
 
 from src.service.llm.engine import LLMEngine
 from src.service.tts.engine import extract_sentences
 from src.db.db_manager import ChatDatabase
-from src.core.config import AppConfig
+from src.core.config import STDOUT_FLUSH_INTERVAL, AppConfig
 
 log = logging.getLogger(__name__)
 
@@ -41,43 +43,26 @@ class LLMPipelineState(TypedDict):
     error: str | None
 
 
-# ── Resource helpers ─────────────────────────────────────────────────
-
-class PipelineResources(TypedDict):
-    """Resources passed via LangGraph's config dict."""
-    llm: LLMEngine
-    db: ChatDatabase
-    app_config: AppConfig
-
-
-def _get_resources(config: RunnableConfig) -> PipelineResources:
-    """Extract pipeline resources from LangGraph config."""
-    return config["configurable"]
-
+# ── Stages ───────────────────────────────────────────────────────────
 
-# ── Node functions ───────────────────────────────────────────────────
-
-async def fetch_history(state: LLMPipelineState, config: RunnableConfig) -> dict:
+async def fetch_history(state: LLMPipelineState, db: ChatDatabase) -> dict:
     """Fetch chat history from the database and append user message."""
-    res = _get_resources(config)
-    db: ChatDatabase = res["db"]
-
     history = await db.get_history()
     history.append({"role": "user", "content": state["user_input"]})
 
     return {"history": history}
 
 
-async def stream_llm(state: LLMPipelineState, config: RunnableConfig) -> dict:
+async def stream_llm(
+    state: LLMPipelineState,
+    llm: LLMEngine,
+    app_config: AppConfig,
+) -> dict:
     """
     Stream LLM response and extract sentences.
 
     Collects the full reply and a list of sentences for the caller to use.
     """
-    res = _get_resources(config)
-    llm: LLMEngine = res["llm"]
-    app_config: AppConfig = res["app_config"]
-
     history = state["history"]
     full_reply_parts: list[str] = []
     sentences: list[str] = []
@@ -86,12 +71,25 @@ async def stream_llm(state: LLMPipelineState, config: RunnableConfig) -> dict:
     t0 = time.perf_counter()
 
     print("\nRin: ", end="", flush=True)
+    # Writes are buffered and flushed on a short timer rather than once per
+    # token, so text still shows up promptly if the stream stalls
+    loop = asyncio.get_running_loop()
+    flush_pending = False
+
+    def _flush() -> None:
+        nonlocal flush_pending
+        flush_pending = False
+        sys.stdout.flush()
+
     try:
         async for chunk in llm.generate_response(
             history, max_retries=app_config.llm.max_retries
         ):
             full_reply_parts.append(chunk)
-            print(chunk, end="", flush=True)
+            sys.stdout.write(chunk)
+            if not flush_pending:
+                flush_pending = True
+                loop.call_later(STDOUT_FLUSH_INTERVAL, _flush)
             buffer += chunk
 
             extracted, buffer = extract_sentences(
@@ -107,7 +105,7 @@ async def stream_llm(state: LLMPipelineState, config: RunnableConfig) -> dict:
     if leftover:
         sentences.append(leftover)
 
-    print()
+    print(flush=True)
 
     elapsed = time.perf_counter() - t0
     full_reply = "".join(full_reply_parts)
@@ -121,30 +119,6 @@ async def stream_llm(state: LLMPipelineState, config: RunnableConfig) -> dict:
     }
 
 
-# ── Graph construction ───────────────────────────────────────────────
-
-def build_llm_pipeline() -> Any:
-    """
-    Build and compile the LLM pipeline graph.
-
-    Returns a compiled graph for LLM streaming only.
-    """
-    graph = StateGraph(LLMPipelineState)
-
-    graph.add_node("fetch_history", fetch_history)
-    graph.add_node("stream_llm", stream_llm)
-
-    graph.add_edge(START, "fetch_history")
-    graph.add_edge("fetch_history", "stream_llm")
-    graph.add_edge("stream_llm", END)
-
-    return graph.compile()
-
-
-# Compile once at module level
-_llm_pipeline = build_llm_pipeline()
-
-
 # ── Public API ───────────────────────────────────────────────────────
 
 async def run_llm_pipeline(
@@ -159,7 +133,7 @@ async def run_llm_pipeline(
     Returns:
         (full_reply, sentences, elapsed_time)
     """
-    initial_state: LLMPipelineState = {
+    state: LLMPipelineState = {
         "user_input": user_input,
         "history": [],
         "full_reply": "",
@@ -168,15 +142,7 @@ async def run_llm_pipeline(
         "error": None,
     }
 
-    result = await _llm_pipeline.ainvoke(
-        initial_state,
-        config={
-            "configurable": {
-                "llm": llm,
-                "db": db,
-                "app_config": config,
-            }
-        },
-    )
-
-    return result["full_reply"], result["sentences"], result["elapsed"]
+    state.update(await fetch_history(state, db))
+    state.update(await stream_llm(state, llm, config))
+
+    return state["full_reply"], state["sentences"], state["elapsed"]
@@ -2,18 +2,24 @@ import torch
 import numpy as np
 import pyaudio
 from .silero_vad_iterator import FixedVADIterator
-import time
+import math
 import threading
 import queue
 import logging
+from collections import deque
 
 log = logging.getLogger(__name__)
 
 
 class ASRProcessor:
-    def __init__(self, buffer_span=20, long_pause_thres=4, start_pad_s=1, end_pad_s=1, vad_threshold=0.65):
+    def __init__(self, buffer_span=20, long_pause_thres=4, start_pad_s=1, end_pad_s=1, vad_threshold=0.65,
+                 on_segment=None):
         self.sample_rate = 16000
+        # Silero is tiny and runs per 32 ms chunk — intra-op threading costs
+        # more than it saves. The hub model is already TorchScript.
+        torch.set_num_threads(1)
         model, _ = torch.hub.load(repo_or_dir='snakers4/silero-vad', model='silero_vad')
+        model.eval()
         self.model = model
         self.vad = FixedVADIterator(self.model, threshold=vad_threshold, sampling_rate=self.sample_rate,
                                     min_silence_duration_ms=250, speech_pad_ms=100)
@@ -21,47 +27,101 @@ class ASRProcessor:
         self.speaking = False
 
         self.buffer_span = buffer_span
-        self.audio_buffer = []
-        self.silence_start_time = None
+        # Silence is measured in captured samples, not wall-clock time, so a
+        # batch of backlogged chunks counts for the audio it actually holds
+        self.silence_samples = None
         self.chunk_size = 512
+        # Backlog (in chunks) at which queued audio is processed in one batch,
+        # and the most chunks taken per batch
+        self.batch_backlog = 2
+        self.max_batch_chunks = 8
+        # Preallocated float32 sample buffer; write_idx marks how much is filled.
+        # One spare batch of headroom, since the span check runs after a write.
+        self._capacity = int(self.sample_rate * buffer_span) + self.chunk_size * self.max_batch_chunks
+        self.audio_buffer = np.zeros(self._capacity, dtype=np.float32)
+        self.write_idx = 0
+        # Scratch space for _trim_silence so trimming doesn't allocate
+        self._abs_scratch = np.empty(self._capacity, dtype=np.float32)
+        self._mask_scratch = np.empty(self._capacity, dtype=bool)
         self.long_pause_th = long_pause_thres
         self.start_pad_s = start_pad_s
         self.end_pad_s = end_pad_s
+        # Sample counts used on every chunk, computed once
+        self._span_samples = self.sample_rate * buffer_span
+        self._long_pause_samples = self.sample_rate * long_pause_thres
+        self._start_pad_samples = int(self.sample_rate * start_pad_s)
+
+        # Capture runs on PortAudio's thread via the stream callback; the chunks
+        # are handed over through a bounded deque (~5 s backlog, oldest dropped).
+        self._chunks: deque[bytes] = deque(maxlen=self.sample_rate * 5 // self.chunk_size)
+        self._chunk_ready = threading.Event()
 
         self.p = pyaudio.PyAudio()
         self.stream = self.p.open(format=pyaudio.paFloat32,
                                 channels=1,
                                 rate=self.sample_rate,
                                 input=True,
-                                frames_per_buffer=self.chunk_size)
+                                frames_per_buffer=self.chunk_size,
+                                stream_callback=self._pa_callback)
 
         self.listening = True
         self.signal = False
         self.chunks_poses_in_buffer = []
         self.start_pose = 0
 
+        # Segments go to on_segment(audio) when given (called on this
+        # processor's thread), otherwise into speech_segments_queue
+        self.on_segment = on_segment
         self.speech_segments_queue = queue.Queue()
         self._stop_event = threading.Event()
 
+    def _pa_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio thread: hand the raw chunk to the processing loop."""
+        self._chunks.append(in_data)
+        self._chunk_ready.set()
+        return (None, pyaudio.paContinue)
+
+    def _next_chunk(self, timeout=0.5):
+        """Pop the oldest captured chunk, waiting up to *timeout* seconds."""
+        while not self._chunks:
+            self._chunk_ready.clear()
+            if self._chunks:  # appended between the check and the clear
+                break
+            if not self._chunk_ready.wait(timeout):
+                return None
+        return self._chunks.popleft()
+
     def process_audio_stream(self):
         while self.listening and not self._stop_event.is_set():
             try:
-                audio_bytes = self.stream.read(self.chunk_size)
+                audio_bytes = self._next_chunk()
+                if audio_bytes is None:
+                    continue
+                # Behind on processing — take queued chunks together so the loop
+                # overhead is paid once. The VAD still steps through them in
+                # 512-sample windows, keeping its recurrent state in order.
+                backlog = len(self._chunks)
+                if backlog >= self.batch_backlog:
+                    parts = [audio_bytes]
+                    for _ in range(min(backlog, self.max_batch_chunks - 1)):
+                        parts.append(self._chunks.popleft())
+                    audio_bytes = b"".join(parts)
                 audio_np = np.frombuffer(audio_bytes, dtype=np.float32)
-                self.audio_buffer.extend(audio_np)
+                self._append_audio(audio_np)
 
-                if len(self.audio_buffer) > self.sample_rate * self.buffer_span:
+                if self.write_idx > self._span_samples:
                     self.process_and_reset()
 
-                vad_result = self.vad(audio_np)
+                with torch.inference_mode():
+                    vad_result = self.vad(audio_np)
 
                 if vad_result is None:
                     if not self.vad.triggered:
-                        if self.silence_start_time is None:
-                            self.silence_start_time = time.time()
+                        if self.silence_samples is None:
+                            self.silence_samples = 0
                         else:
-                            silence_duration = time.time() - self.silence_start_time
-                            if silence_duration >= self.long_pause_th:
+                            self.silence_samples += len(audio_np)
+                            if self.silence_samples >= self._long_pause_samples:
                                 self.process_and_reset()
                     continue
 
@@ -70,13 +130,13 @@ class ASRProcessor:
                         self.signal = True
                     log.debug('Speech detected')
                     self.speaking = True
-                    self.start_pose = max(0, len(self.audio_buffer) - self.sample_rate * self.start_pad_s)
-                    self.silence_start_time = None
+                    self.start_pose = max(0, self.write_idx - self._start_pad_samples)
+                    self.silence_samples = None
 
                 elif 'end' in vad_result:
                     log.debug('Speech ended')
                     self.speaking = False
-                    self.chunks_poses_in_buffer.append([self.start_pose, len(self.audio_buffer)])
+                    self.chunks_poses_in_buffer.append([self.start_pose, self.write_idx])
 
             except IOError as e:
                 log.error("PyAudio IOError: %s", e)
@@ -87,20 +147,32 @@ class ASRProcessor:
                 self._stop_event.set()
                 break
 
+    def _append_audio(self, audio_np: np.ndarray):
+        """Copy a captured chunk into the preallocated buffer."""
+        if self.write_idx + len(audio_np) > self._capacity:
+            self.process_and_reset()
+        end = self.write_idx + len(audio_np)
+        self.audio_buffer[self.write_idx:end] = audio_np
+        self.write_idx = end
+
     def process_and_reset(self):
         speech_seg = self._extract_speech_seg()
         if len(speech_seg) > self.sample_rate:
             self._queue_speech_segment(speech_seg)
         self.vad.reset_states()
-        self.audio_buffer = self.audio_buffer[-int(self.sample_rate * self.start_pad_s):]
-        self.start_pose = max(0, len(self.audio_buffer) - self.sample_rate * self.start_pad_s)
+        # Keep the last start_pad_s seconds as pre-roll for the next utterance
+        keep = min(self.write_idx, self._start_pad_samples)
+        self.audio_buffer[:keep] = self.audio_buffer[self.write_idx - keep:self.write_idx]
+        self.write_idx = keep
+        self.start_pose = max(0, self.write_idx - self._start_pad_samples)
         self.chunks_poses_in_buffer = []
         self.signal = False
-        self.silence_start_time = None
+        self.silence_samples = None
 
     def _extract_speech_seg(self):
-        end_sample = len(self.audio_buffer) - max(0, ((self.long_pause_th - self.end_pad_s) * self.sample_rate))
-        segment = np.array(self.audio_buffer)[int(0):int(end_sample)]
+        end_sample = self.write_idx - max(0, ((self.long_pause_th - self.end_pad_s) * self.sample_rate))
+        # View into the buffer — _queue_speech_segment copies before it's reused
+        segment = self.audio_buffer[:self.write_idx][int(0):int(end_sample)]
         return self._trim_silence(segment)
 
     def _trim_silence(self, audio):
@@ -114,28 +186,36 @@ class ASRProcessor:
 
         if len(trimmed_audio) > 0:
             noise_window = audio[:int(self.sample_rate * 0.05)]
-            noise_energy = np.sqrt(np.mean(noise_window**2)) + 1e-10
+            noise_energy = math.sqrt(float(np.dot(noise_window, noise_window)) / noise_window.size) + 1e-10
             threshold = noise_energy * 0.5
-            non_silent_mask = np.abs(trimmed_audio) > threshold
 
-            if non_silent_mask.any():
-                start_idx = np.argmax(non_silent_mask)
-                end_idx = len(trimmed_audio) - np.argmax(non_silent_mask[::-1])
+            n = len(trimmed_audio)
+            abs_audio = np.abs(trimmed_audio, out=self._abs_scratch[:n])
+            non_silent_mask = np.greater(abs_audio, threshold, out=self._mask_scratch[:n])
+
+            # argmax stops at the first True; the reversed mask is a view
+            start_idx = np.argmax(non_silent_mask)
+            if non_silent_mask[start_idx]:
+                end_idx = n - np.argmax(non_silent_mask[::-1])
                 trimmed_audio = trimmed_audio[start_idx:end_idx]
 
         return trimmed_audio if len(trimmed_audio) > 0 else np.array([])
 
     def _queue_speech_segment(self, audio_segment: np.ndarray):
-        """Put raw float32 audio segment into the queue for transcription."""
+        """Hand a float32 copy of the audio segment off for transcription."""
         if len(audio_segment) == 0:
             return
-        self.speech_segments_queue.put(audio_segment.astype(np.float32))
+        segment = audio_segment.astype(np.float32, copy=True)
+        if self.on_segment is not None:
+            self.on_segment(segment)
+        else:
+            self.speech_segments_queue.put(segment)
         log.info("Queued speech segment: %.2fs", len(audio_segment) / self.sample_rate)
 
     def stop(self):
         self._stop_event.set()
         self.listening = False
-        if self.audio_buffer:
+        if self.write_idx:
             self.process_and_reset()
 
         try:
@@ -114,11 +114,15 @@ class FixedVADIterator(VADIterator):
         self.buffer = np.array([],dtype=np.float32)
 
     def __call__(self, x, return_seconds=False):
-        self.buffer = np.append(self.buffer, x) 
+        # Only copy when there's a carried-over remainder; otherwise step
+        # through the caller's array (e.g. an np.frombuffer view) directly
+        if len(self.buffer):
+            x = np.concatenate((self.buffer, x))
         ret = None
-        while len(self.buffer) >= 512:
-            r = super().__call__(self.buffer[:512], return_seconds=return_seconds)
-            self.buffer = self.buffer[512:]
+        pos = 0
+        while len(x) - pos >= 512:
+            r = super().__call__(x[pos:pos + 512], return_seconds=return_seconds)
+            pos += 512
             if ret is None:
                 ret = r
             elif r is not None:
@@ -127,6 +131,7 @@ class FixedVADIterator(VADIterator):
                 if 'start' in r and 'end' in ret:  # there is an earlier start.
                     # Remove end, merging this segment with the previous one.
                     del ret['end']
+        self.buffer = x[pos:]
         return ret if ret != {} else None
 
 if __name__ == "__main__":
@@ -42,6 +42,14 @@ class LLMProvider(ABC):
     async def start(self) -> None:
         """Optional lifecycle hook — called before first use."""
 
+    async def warmup(self, messages: list[dict[str, str]]) -> None:
+        """
+        Optional hook — prime the backend with *messages* after start().
+
+        Runs in the background at startup so the first real request finds
+        the model (and, where supported, the prompt prefix) already hot.
+        """
+
     async def stop(self) -> None:
         """Optional lifecycle hook — called on shutdown."""
 
@@ -6,8 +6,10 @@ This is the only LLM interface that app.py should use.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from contextlib import aclosing
 from typing import AsyncGenerator
 
 from src.service.llm.providers import get_llm_provider
@@ -15,6 +17,13 @@ from src.core.prompt import SYSTEM_PROMPT
 
 log = logging.getLogger(__name__)
 
+# A retry that also comes back empty this fast means the server isn't
+# going to answer; stop instead of re-sending the prompt again
+_FAST_EMPTY_SECS = 0.5
+
+# Shared by every turn without memory context — never mutated
+_SYSTEM_MSG: dict[str, str] = {"role": "system", "content": SYSTEM_PROMPT}
+
 
 class LLMEngine:
     """
@@ -24,7 +33,7 @@ class LLMEngine:
       - Prepend the system prompt to every request
       - Optionally inject memory context into system prompt
       - Retry on empty responses (known llama.cpp quirk)
-      - Lifecycle management (start/stop the provider)
+      - Lifecycle management (start/stop the provider, background warmup)
 
     The actual streaming is delegated to the selected provider.
     """
@@ -33,13 +42,36 @@ class LLMEngine:
         self._cfg = config.llm
         provider_cls = get_llm_provider(self._cfg.provider)
         self._provider = provider_cls(self._cfg.provider_config)
+        self._warmup_task: asyncio.Task[None] | None = None
 
     # ── lifecycle ────────────────────────────────────────────────────
 
     async def start(self) -> None:
         await self._provider.start()
+        if self._cfg.warmup:
+            # Fire-and-forget: startup continues (TTS/STT load, session
+            # dialog) while the server processes the system prompt
+            self._warmup_task = asyncio.create_task(self._warmup())
+
+    async def _warmup(self) -> None:
+        t0 = time.perf_counter()
+        try:
+            await self._provider.warmup(
+                [_SYSTEM_MSG, {"role": "user", "content": "hi"}]
+            )
+        except Exception as e:
+            log.warning("LLM warmup failed: %s", e)
+            return
+        log.info("LLM warmup finished in %.2fs", time.perf_counter() - t0)
 
     async def stop(self) -> None:
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+        self._warmup_task = None
         await self._provider.stop()
 
     async def __aenter__(self) -> LLMEngine:
@@ -70,21 +102,25 @@ class LLMEngine:
         max_retries = max_retries or self._cfg.max_retries
 
         # Build system prompt with optional memory
-        system_content = SYSTEM_PROMPT
+        system_msg = _SYSTEM_MSG
         if memory_context:
-            system_content = f"{SYSTEM_PROMPT}\n\n{memory_context}"
+            system_msg = {
+                "role": "system",
+                "content": f"{SYSTEM_PROMPT}\n\n{memory_context}",
+            }
 
-        full_messages = [
-            {"role": "system", "content": system_content}
-        ] + messages
+        full_messages = [system_msg, *messages]
 
         for attempt in range(1, max_retries + 1):
             got_content = False
             t0 = time.perf_counter()
 
-            async for chunk in self._provider.stream(full_messages):
-                got_content = True
-                yield chunk
+            # aclosing: if the caller stops early (cancel/Ctrl+C) the provider
+            # stream is closed right away, releasing the server slot
+            async with aclosing(self._provider.stream(full_messages)) as chunks:
+                async for chunk in chunks:
+                    got_content = True
+                    yield chunk
 
             elapsed = time.perf_counter() - t0
 
@@ -92,6 +128,14 @@ class LLMEngine:
                 log.info("LLM turn completed in %.2fs", elapsed)
                 return
 
+            if attempt > 1 and elapsed < _FAST_EMPTY_SECS:
+                log.error(
+                    "LLM returned empty again within %.2fs — giving up after %d attempts",
+                    elapsed,
+                    attempt,
+                )
+                return
+
             if attempt < max_retries:
                 log.warning(
                     "LLM returned empty response — retrying (%d/%d)",
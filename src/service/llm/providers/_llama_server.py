@@ -15,9 +15,14 @@ import httpx
 
 log = logging.getLogger(__name__)
 
-_HEALTH_POLL_INTERVAL = 1.0   # seconds between /health checks
+_HEALTH_POLL_INTERVAL = 0.1   # seconds between /health checks
+_HEALTH_PROBE_TIMEOUT = 1.0   # per-request timeout for a single check
 _HEALTH_TIMEOUT = 120.0       # seconds before giving up on server start
 
+# stderr lines that hint the server may now be ready — each one triggers an
+# immediate /health probe instead of waiting for the next poll
+_READY_MARKERS = (b"server is listening", b"model loaded")
+
 
 class LlamaServer:
     """Async context-manager that owns the llama-server process."""
@@ -29,6 +34,13 @@ class LlamaServer:
         self._health_url = f"http://{host}:{port}/health"
         self._process: asyncio.subprocess.Process | None = None
         self._log_task: asyncio.Task | None = None
+        self._ready_hint = asyncio.Event()
+        # Probes reuse one kept-alive localhost connection
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=1, keepalive_expiry=120.0
+            ),
+        )
 
     # ── build command ────────────────────────────────────────────────
 
@@ -66,32 +78,64 @@ class LlamaServer:
     async def _forward_output(self) -> None:
         if self._process is None or self._process.stderr is None:
             return
+        stderr = self._process.stderr
+        pending = bytearray()
         try:
-            async for line in self._process.stderr:
-                text = line.decode("utf-8", errors="replace").rstrip()
-                if text:
-                    log.debug("[llama-server] %s", text)
+            # Take whatever has arrived in one go and split it here, rather
+            # than awaiting readline() once per line of startup chatter
+            while data := await stderr.read(4096):
+                # Re-checked per read so a runtime level change takes effect
+                debug = log.isEnabledFor(logging.DEBUG)
+                pending += data
+                start = 0
+                while (end := pending.find(b"\n", start)) != -1:
+                    self._handle_output_line(pending[start:end], debug)
+                    start = end + 1
+                del pending[:start]
+            if pending:
+                self._handle_output_line(pending, log.isEnabledFor(logging.DEBUG))
         except asyncio.CancelledError:
             pass
 
+    def _handle_output_line(self, line: bytes | bytearray, debug: bool) -> None:
+        # Markers are matched on the raw bytes, so lines are only decoded
+        # when they are actually going to be logged
+        if any(marker in line for marker in _READY_MARKERS):
+            self._ready_hint.set()
+        if debug:
+            text = line.decode("utf-8", errors="replace").rstrip()
+            if text:
+                log.debug("[llama-server] %s", text)
+
     # ── health polling ───────────────────────────────────────────────
 
     async def _wait_ready(self) -> None:
-        elapsed = 0.0
-        async with httpx.AsyncClient() as client:
-            while elapsed < _HEALTH_TIMEOUT:
-                try:
-                    resp = await client.get(self._health_url, timeout=5.0)
-                    if resp.status_code == 200:
-                        log.info("llama-server is ready.")
-                        return
-                except httpx.ConnectError:
-                    pass
-                except httpx.ReadError:
-                    pass
-
-                await asyncio.sleep(_HEALTH_POLL_INTERVAL)
-                elapsed += _HEALTH_POLL_INTERVAL
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _HEALTH_TIMEOUT
+        while loop.time() < deadline:
+            try:
+                resp = await self._client.get(
+                    self._health_url, timeout=_HEALTH_PROBE_TIMEOUT
+                )
+                if resp.status_code == 200:
+                    log.info("llama-server is ready.")
+                    return
+            except httpx.ConnectError:
+                pass
+            except httpx.ReadError:
+                pass
+            except httpx.TimeoutException:
+                pass
+
+            # Sleep until the next poll, or wake early when the server
+            # logs that it is listening / has loaded the model
+            try:
+                await asyncio.wait_for(
+                    self._ready_hint.wait(), timeout=_HEALTH_POLL_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._ready_hint.clear()
 
         raise TimeoutError(
             f"llama-server did not become healthy within {_HEALTH_TIMEOUT}s"
@@ -114,6 +158,7 @@ class LlamaServer:
         await self._wait_ready()
 
     async def stop(self) -> None:
+        await self._client.aclose()
         if self._process is None:
             return
 
@@ -14,6 +14,7 @@ import logging
 import time
 from typing import Any, AsyncGenerator
 
+import httpx
 from openai import AsyncOpenAI
 
 from src.service.llm.base import LLMProvider
@@ -35,6 +36,23 @@ class OpenAICompatProvider(LLMProvider):
         self._frequency_penalty = config.get("frequency_penalty", 0.0)
         self._presence_penalty = config.get("presence_penalty", 0.0)
         self._timeout = config.get("timeout", 30.0)
+        # llama.cpp extension: keep the KV cache of the shared prompt prefix
+        # (system prompt + history) between requests. Defaults on only when
+        # we manage a llama-server, since other servers may reject the field.
+        self._cache_prompt = config.get(
+            "cache_prompt", self._server_cfg.get("enabled", False),
+        )
+
+        # One connection pool for the provider's lifetime, shared by every
+        # AsyncOpenAI client below so each turn/retry reuses a warm socket
+        self._http = httpx.AsyncClient(
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=8,
+                max_keepalive_connections=4,
+                keepalive_expiry=120.0,
+            ),
+        )
 
         # Build initial client — may be replaced in start() if server
         # provides its own host/port.
@@ -47,6 +65,7 @@ class OpenAICompatProvider(LLMProvider):
             base_url=base_url,
             api_key=self._config.get("api_key", "not-needed"),
             timeout=self._timeout,
+            http_client=self._http,
         )
 
     # ── lifecycle ────────────────────────────────────────────────────
@@ -62,7 +81,22 @@ class OpenAICompatProvider(LLMProvider):
                 f"http://{host}:{port}/v1"
             )
 
+    async def warmup(self, messages: list[dict[str, str]]) -> None:
+        # One-token completion: loads weights/kernels and, with cache_prompt,
+        # leaves the system prompt's KV cache in place for the first turn
+        create_kwargs: dict = dict(
+            model=self._model,
+            messages=messages,
+            temperature=0.0,
+            max_tokens=1,
+            stream=False,
+        )
+        if self._cache_prompt:
+            create_kwargs["extra_body"] = {"cache_prompt": True}
+        await self._client.chat.completions.create(**create_kwargs)
+
     async def stop(self) -> None:
+        await self._http.aclose()
         if self._server is not None:
             await self._server.stop()
             self._server = None
@@ -74,6 +108,7 @@ class OpenAICompatProvider(LLMProvider):
     ) -> AsyncGenerator[str, None]:
         t0 = time.perf_counter()
         token_count = 0
+        empty_chunks = 0
         finish_reason = None
 
         create_kwargs: dict = dict(
@@ -86,23 +121,40 @@ class OpenAICompatProvider(LLMProvider):
         )
         if self._max_tokens is not None:
             create_kwargs["max_tokens"] = self._max_tokens
+        if self._cache_prompt:
+            create_kwargs["extra_body"] = {"cache_prompt": True}
 
         try:
             stream = await self._client.chat.completions.create(**create_kwargs)
 
-            async for chunk in stream:
-                if not chunk.choices:
-                    log.debug("Chunk with empty choices: %s", chunk)
-                    continue
-
-                choice = chunk.choices[0]
-                if choice.finish_reason:
-                    finish_reason = choice.finish_reason
-
-                text = getattr(choice.delta, "content", None)
-                if text:
-                    token_count += 1
-                    yield text
+            # Hot loop — checked once so disabled debug logging costs nothing
+            debug = log.isEnabledFor(logging.DEBUG)
+            try:
+                async for chunk in stream:
+                    choices = chunk.choices
+                    if not choices:
+                        # Log a counter, not the chunk — its pydantic repr
+                        # is costly and rarely useful
+                        empty_chunks += 1
+                        if debug:
+                            log.debug("Chunk with empty choices (#%d)", empty_chunks)
+                        continue
+
+                    choice = choices[0]
+                    delta = choice.delta
+                    text = delta.content if delta is not None else None
+                    if text:
+                        token_count += 1
+                        yield text
+
+                    # Usually only set on the final (empty-delta) chunk, but
+                    # some servers attach it to the last content chunk
+                    if choice.finish_reason is not None:
+                        finish_reason = choice.finish_reason
+            finally:
+                # Drop the HTTP response now (also on early close/cancel) so
+                # llama.cpp stops decoding for a reply nobody will read
+                await stream.close()
 
         except Exception as e:
             log.error("LLM streaming failed: %s", e)
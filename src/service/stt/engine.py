@@ -9,14 +9,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import queue
 import threading
+from typing import TYPE_CHECKING
 
 import numpy as np
 
-from src.service.asr.asr import ASRProcessor
 from src.service.stt.providers import get_stt_provider
 
+if TYPE_CHECKING:
+    from src.service.asr.asr import ASRProcessor
+
 log = logging.getLogger(__name__)
 
 
@@ -38,6 +40,8 @@ class STTEngine:
         self._running = False
         self._listener_task: asyncio.Task | None = None
         self._asr: ASRProcessor | None = None
+        # Speech segments from the ASR thread, delivered via the event loop
+        self._segments: asyncio.Queue[np.ndarray] = asyncio.Queue()
         self._asr_thread: threading.Thread | None = None
 
     # ── lifecycle ────────────────────────────────────────────────────
@@ -52,10 +56,24 @@ class STTEngine:
             return
         self._running = True
 
+        # Deferred: pulls in torch, Silero and PyAudio — not needed unless
+        # listening actually starts
+        from src.service.asr.asr import ASRProcessor
+
+        loop = asyncio.get_running_loop()
+
+        def _on_segment(audio: np.ndarray) -> None:
+            # Runs on the ASR thread — hand over to the loop, no polling
+            try:
+                loop.call_soon_threadsafe(self._segments.put_nowait, audio)
+            except RuntimeError:  # loop already closed during shutdown
+                pass
+
         self._asr = ASRProcessor(
             buffer_span=int(self._cfg.max_duration),
             long_pause_thres=self._cfg.silence_duration,
             vad_threshold=self._cfg.vad_threshold,
+            on_segment=_on_segment,
         )
         self._asr_thread = threading.Thread(
             target=self._asr.process_audio_stream, daemon=True
@@ -86,21 +104,12 @@ class STTEngine:
     # ── background listener ──────────────────────────────────────────
 
     async def _listener_loop(self) -> None:
-        """Pull speech segments from ASRProcessor and transcribe them."""
-        loop = asyncio.get_running_loop()
+        """Await speech segments from ASRProcessor and transcribe them."""
         while self._running:
             try:
-                audio = await loop.run_in_executor(
-                    None,
-                    lambda: self._asr.speech_segments_queue.get(timeout=0.5),
-                )
-            except queue.Empty:
-                continue
+                audio = await self._segments.get()
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                log.error("Error getting speech segment: %s", e)
-                continue
 
             if len(audio) == 0:
                 continue
@@ -15,9 +15,15 @@ _REGISTRY: dict[str, tuple[str, str]] = {
     ),
 }
 
+# Resolved classes, so repeat lookups skip the import machinery.
+_CLASS_CACHE: dict[str, type[STTProvider]] = {}
+
 
 def get_stt_provider(name: str) -> type[STTProvider]:
     """Return the STTProvider class for *name*, importing lazily."""
+    cls = _CLASS_CACHE.get(name)
+    if cls is not None:
+        return cls
     if name not in _REGISTRY:
         available = ", ".join(sorted(_REGISTRY))
         raise ValueError(
@@ -25,4 +31,5 @@ def get_stt_provider(name: str) -> type[STTProvider]:
         )
     module_path, class_name = _REGISTRY[name]
     module = importlib.import_module(module_path)
-    return getattr(module, class_name)
+    cls = _CLASS_CACHE[name] = getattr(module, class_name)
+    return cls
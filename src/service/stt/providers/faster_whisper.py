@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
@@ -13,6 +15,10 @@ from src.service.stt.base import STTProvider
 
 log = logging.getLogger(__name__)
 
+# Segments quieter than this (RMS of float32 audio in [-1, 1]) are treated
+# as silence and never reach the model
+_SILENCE_RMS = 1e-3
+
 
 class FasterWhisperProvider(STTProvider):
     """Transcribes audio using faster-whisper (CTranslate2 backend)."""
@@ -20,13 +26,35 @@ class FasterWhisperProvider(STTProvider):
     def __init__(self, config: dict[str, Any]) -> None:
         self._model_name = config.get("model", "distil-medium.en")
         self._device = config.get("device", "cuda")
-        self._compute_type = config.get("compute_type", "float16")
+        self._compute_type = config.get("compute_type", "int8_float16")
         self._language = config.get("language", "en")
+        # Greedy, single-pass decoding by default — the utterance is short
+        # and latency matters more than the accuracy gain from beam search.
+        # This also drops faster-whisper's temperature fallback (its guard
+        # against repetition/hallucination loops on noisy audio); set
+        # temperature to a list such as [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+        # with best_of: 5 to get it back.
+        self._beam_size = config.get("beam_size", 1)
+        self._best_of = config.get("best_of", 1)
+        temperature = config.get("temperature", 0.0)
+        self._temperature = (
+            tuple(temperature) if isinstance(temperature, (list, tuple)) else temperature
+        )
+        self._condition_on_previous_text = config.get(
+            "condition_on_previous_text", False
+        )
         self._model = None
+        # Dedicated worker: loading and every transcription run on the same
+        # thread, one at a time, away from the shared default pool
+        self._pool: ThreadPoolExecutor | None = None
 
     async def initialize(self) -> None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="stt"
+            )
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._load)
+        await loop.run_in_executor(self._pool, self._load)
 
     def _load(self) -> None:
         from faster_whisper import WhisperModel
@@ -48,15 +76,30 @@ class FasterWhisperProvider(STTProvider):
     async def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
         if len(audio) == 0:
             return ""
+        # Cheap guard against VAD misfires on background noise — saves a
+        # full encoder pass on nothing
+        rms = math.sqrt(float(np.dot(audio, audio)) / audio.size)
+        if rms < _SILENCE_RMS:
+            log.debug("Skipping silent segment (rms=%.5f)", rms)
+            return ""
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._transcribe_sync, audio)
+        return await loop.run_in_executor(
+            self._pool, self._transcribe_sync, audio
+        )
 
     def _transcribe_sync(self, audio: np.ndarray) -> str:
         segments, info = self._model.transcribe(
             audio,
             language=self._language,
-            beam_size=5,
+            beam_size=self._beam_size,
+            best_of=self._best_of,
+            temperature=self._temperature,
+            condition_on_previous_text=self._condition_on_previous_text,
+            # Only the text is used — skip timestamp tokens entirely
+            without_timestamps=True,
+            word_timestamps=False,
             vad_filter=True,
+            vad_parameters={"threshold": 0.5, "min_silence_duration_ms": 500},
         )
         text = " ".join(seg.text.strip() for seg in segments).strip()
         log.info(
@@ -69,3 +112,6 @@ class FasterWhisperProvider(STTProvider):
 
     async def shutdown(self) -> None:
         self._model = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
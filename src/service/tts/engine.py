@@ -10,7 +10,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import threading
 import time
+from collections import deque
+from typing import AsyncIterator
 
 import numpy as np
 import sounddevice as sd
@@ -23,6 +26,11 @@ log = logging.getLogger(__name__)
 
 _SENTENCE_SPLIT = re.compile(r"(?<=[.!?~])\s+")
 
+# Characters _SENTENCE_SPLIT treats as sentence ends — keep the two in sync.
+# Streaming callers use this to skip extract_sentences() on chunks that
+# cannot complete a sentence.
+SENTENCE_TERMINATORS = frozenset(".!?~")
+
 _KAOMOJI = re.compile(
     r"[\(（][\s]*[>≧≦╥ᗒᗣᗕ°▽TQOoUuXx;:'^,.*_\-\+~!?ಥ☆★♡♥ω\\/|]+"
     r"[^\)）]*[\)）]"
@@ -34,17 +42,16 @@ _UNSPEAKABLE = re.compile(r"[>:;()\[\]{}<>^_~=*#@|/\\`\"]+")
 # Asterisk actions like *sighs* or *winks* — capture inner text
 _ASTERISK_ACTIONS = re.compile(r"\*([^*]+)\*")
 
-# Emoji pattern (covers most Unicode emoji ranges)
+# Emoji pattern (covers most Unicode emoji ranges) — one character class
+# rather than an alternation, so each character is tested once
 _EMOJI = re.compile(
-    r"[\U0001F300-\U0001F9FF]"  # Misc symbols, emoticons, dingbats
-    r"|[\U0001FA00-\U0001FAFF]"  # Extended symbols
-    r"|[\U00002600-\U000027BF]"  # Misc symbols
-    r"|[\U0001F600-\U0001F64F]"  # Emoticons
-    r"|[\U0001F680-\U0001F6FF]"  # Transport/map
-    r"|[\U0001F1E0-\U0001F1FF]"  # Flags
-    r"|[\U00002700-\U000027BF]"  # Dingbats
-    r"|[\U0000FE00-\U0000FE0F]"  # Variation selectors
-    r"|[\U0001F900-\U0001F9FF]"  # Supplemental symbols
+    "["
+    "\U0001F300-\U0001F9FF"  # Misc symbols, emoticons, transport, supplemental
+    "\U0001FA00-\U0001FAFF"  # Extended symbols
+    "\U00002600-\U000027BF"  # Misc symbols, dingbats
+    "\U0001F1E0-\U0001F1FF"  # Flags
+    "\U0000FE00-\U0000FE0F"  # Variation selectors
+    "]"
 )
 
 # Common text emoticons
@@ -54,6 +61,13 @@ _TEXT_EMOTICONS = (
     "<3", "</3", "^^", "^_^", "-_-", ">_<", "._.", "o.o",
 )
 
+# All emoticons in one scan, longest first so ">:3" wins over ":3"
+_TEXT_EMOTICON_RE = re.compile(
+    "|".join(map(re.escape, sorted(_TEXT_EMOTICONS, key=len, reverse=True)))
+)
+
+_MULTI_SPACE = re.compile(r"\s{2,}")
+
 
 def _clean_for_speech(text: str) -> str:
     """
@@ -76,14 +90,13 @@ def _clean_for_speech(text: str) -> str:
     text = _EMOJI.sub("", text)
 
     # Remove text emoticons
-    for emote in _TEXT_EMOTICONS:
-        text = text.replace(emote, "")
+    text = _TEXT_EMOTICON_RE.sub("", text)
 
     # Remove unspeakable symbols
     text = _UNSPEAKABLE.sub(" ", text)
 
     # Collapse multiple spaces
-    return re.sub(r"\s{2,}", " ", text).strip()
+    return _MULTI_SPACE.sub(" ", text).strip()
 
 
 def extract_sentences(buffer: str, min_chars: int = 12) -> tuple[list[str], str]:
@@ -114,6 +127,18 @@ def extract_sentences(buffer: str, min_chars: int = 12) -> tuple[list[str], str]
 
 # ── TTS Engine ───────────────────────────────────────────────────────────
 
+class _QueuedAudio:
+    """A buffer waiting in (or being drained by) the playback queue."""
+
+    __slots__ = ("samples", "position", "loop", "done")
+
+    def __init__(self, samples: np.ndarray, loop: asyncio.AbstractEventLoop) -> None:
+        self.samples = samples
+        self.position = 0
+        self.loop = loop
+        self.done = asyncio.Event()
+
+
 class TTSEngine:
     """
     Orchestrates a TTS provider.
@@ -121,6 +146,7 @@ class TTSEngine:
     Responsibilities (engine-level):
       - Text cleaning (strip kaomoji, unspeakable symbols)
       - Audio playback via sounddevice
+      - Overlapping synthesis with playback for streamed sentences
 
     Synthesis is delegated to the selected provider.
     """
@@ -130,82 +156,115 @@ class TTSEngine:
         provider_cls = get_tts_provider(self._cfg.provider)
         self._provider = provider_cls(self._cfg.provider_config)
 
+        # One output stream for the engine's lifetime, fed from a queue of
+        # pending buffers by the audio callback
+        self._stream: sd.OutputStream | None = None
+        self._stream_rate: int | None = None
+        self._playback: deque[_QueuedAudio] = deque()
+        self._playback_lock = threading.Lock()
+
     async def initialize(self) -> None:
-        """Load the TTS provider's model."""
+        """Load the TTS provider's model and open the audio output."""
         await self._provider.initialize()
+        try:
+            self._ensure_stream(self._cfg.sample_rate)
+        except Exception as e:
+            # Not fatal — playback retries opening the stream
+            log.error("Could not open audio output: %s", e)
 
     async def shutdown(self) -> None:
-        """Release provider resources."""
+        """Release provider resources and close the audio output."""
+        self._close_stream()
         await self._provider.shutdown()
 
+    # ── playback ─────────────────────────────────────────────────────
+
+    def _ensure_stream(self, sample_rate: int) -> sd.OutputStream:
+        """Return the running output stream, (re)opening it if needed."""
+        if self._stream is not None and self._stream_rate == sample_rate:
+            return self._stream
+        self._close_stream()
+        stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype="float32",
+            callback=self._audio_callback,
+        )
+        stream.start()
+        self._stream, self._stream_rate = stream, sample_rate
+        return stream
+
+    def _close_stream(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = self._stream_rate = None
+
+    def _audio_callback(self, outdata, frames, time_info, status) -> None:
+        """Fill *outdata* from the playback queue (runs on the audio thread)."""
+        if status:
+            log.warning("Audio callback status: %s", status)
+
+        out = outdata[:, 0]
+        filled = 0
+        with self._playback_lock:
+            while filled < frames and self._playback:
+                item = self._playback[0]
+                n = min(frames - filled, len(item.samples) - item.position)
+                out[filled:filled + n] = item.samples[item.position:item.position + n]
+                item.position += n
+                filled += n
+                if item.position >= len(item.samples):
+                    self._playback.popleft()
+                    item.loop.call_soon_threadsafe(item.done.set)
+        # Nothing queued — keep the device open and play silence
+        out[filled:] = 0
+
     async def _play_audio_async(self, samples: np.ndarray, sample_rate: int) -> None:
         """
-        Non-blocking audio playback using OutputStream with finished callback.
+        Non-blocking audio playback through the persistent output stream.
 
-        Uses an asyncio.Event to signal completion, allowing the event loop
-        to remain fully responsive (GUI updates work) while audio plays.
+        The stream is opened once and kept running; each call queues its
+        samples and waits on an asyncio.Event set from the audio thread
+        when the last of them has been handed to the device. Cancelling
+        the call drops any part that hasn't been played yet.
         """
-        loop = asyncio.get_running_loop()
-        finished_event = asyncio.Event()
-
-        # Track playback position
-        position = 0
-        samples_len = len(samples)
-
-        def audio_callback(outdata, frames, time_info, status):
-            nonlocal position
-            if status:
-                log.warning("Audio callback status: %s", status)
-
-            chunk_end = position + frames
-            if chunk_end <= samples_len:
-                outdata[:, 0] = samples[position:chunk_end]
-                position = chunk_end
-            else:
-                # End of audio — fill remaining with zeros
-                valid = samples_len - position
-                if valid > 0:
-                    outdata[:valid, 0] = samples[position:]
-                outdata[valid:, 0] = 0
-                position = samples_len
-                raise sd.CallbackStop()
-
-        def finished_callback():
-            # Called from audio thread when stream finishes
-            loop.call_soon_threadsafe(finished_event.set)
-
         try:
-            stream = sd.OutputStream(
-                samplerate=sample_rate,
-                channels=1,
-                callback=audio_callback,
-                finished_callback=finished_callback,
-            )
-            with stream:
-                stream.start()
-                await finished_event.wait()
+            self._ensure_stream(sample_rate)
         except Exception as e:
             log.error("Audio playback error: %s", e)
             raise
 
-    async def speak(self, text: str) -> None:
+        item = _QueuedAudio(samples, asyncio.get_running_loop())
+        with self._playback_lock:
+            self._playback.append(item)
+        try:
+            await item.done.wait()
+        finally:
+            if not item.done.is_set():
+                with self._playback_lock:
+                    try:
+                        self._playback.remove(item)
+                    except ValueError:
+                        pass
+
+    async def synthesize(self, text: str) -> tuple[np.ndarray, int] | None:
         """
-        Clean *text*, synthesize via provider, and play through speakers.
+        Clean *text* and synthesize it via the provider.
 
-        Uses non-blocking playback so the GUI remains responsive.
+        Returns ``(samples, sample_rate)``, or None if there is nothing
+        speakable or synthesis failed.
         """
         clean = _clean_for_speech(text)
         if not clean:
             log.debug("Nothing speakable in: %r", text)
-            return
+            return None
 
-        # ── synthesize via provider ──────────────────────────────────
         t0 = time.perf_counter()
         try:
             samples, sr = await self._provider.synthesize(clean)
         except Exception as e:
             log.error("TTS synthesis failed: %s", e)
-            return
+            return None
 
         synth_time = time.perf_counter() - t0
         duration = len(samples) / sr
@@ -213,9 +272,47 @@ class TTSEngine:
             "TTS synthesised %.1fs audio in %.2fs | text=%r",
             duration, synth_time, clean,
         )
+        return samples, sr
 
-        # ── play (non-blocking) ───────────────────────────────────────
+    async def play(self, samples: np.ndarray, sample_rate: int) -> None:
+        """Play synthesized audio through the speakers (non-blocking)."""
         try:
-            await self._play_audio_async(samples, sr)
+            await self._play_audio_async(samples, sample_rate)
         except Exception as e:
             log.error("TTS playback failed: %s", e)
+
+    async def speak(self, text: str) -> None:
+        """
+        Clean *text*, synthesize via provider, and play through speakers.
+
+        Uses non-blocking playback so the GUI remains responsive.
+        """
+        audio = await self.synthesize(text)
+        if audio is not None:
+            await self.play(*audio)
+
+    async def speak_stream(self, sentences: AsyncIterator[str]) -> None:
+        """
+        Speak sentences as they arrive, in order.
+
+        Synthesis of the next sentence overlaps playback of the current one,
+        and its audio is queued on the output stream before the current one
+        ends, so consecutive sentences play back to back. At most one
+        sentence waits behind the one playing.
+        """
+        playing: deque[asyncio.Task] = deque()
+        try:
+            async for sentence in sentences:
+                audio = await self.synthesize(sentence)
+                if audio is None:
+                    continue
+                # Playback order is the stream queue's order, so queue now
+                # and only wait once a sentence is already lined up
+                playing.append(asyncio.create_task(self.play(*audio)))
+                if len(playing) > 2:
+                    await playing.popleft()
+            while playing:
+                await playing.popleft()
+        finally:
+            for task in playing:
+                task.cancel()
@@ -1,6 +1,11 @@
 """Dynamic personality plugin — AI personality state tracking."""
 
 from .status_manager import StatusManager, SectionLimit
-from .memory_updater import update_memory_background
+from .memory_updater import MemoryUpdateWorker, update_memory_background
 
-__all__ = ["StatusManager", "SectionLimit", "update_memory_background"]
+__all__ = [
+    "StatusManager",
+    "SectionLimit",
+    "MemoryUpdateWorker",
+    "update_memory_background",
+]
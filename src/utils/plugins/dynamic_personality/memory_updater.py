@@ -11,7 +11,8 @@ import ast
 import asyncio
 import json
 import logging
-import re
+import string
+from collections import deque
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,14 +21,10 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
-# Prompt for memory extraction
-_MEMORY_PROMPT = """Analyze if these recent exchanges warrant a memory update.
-
-CURRENT MEMORY (turns since last update):
-{current_memory}
-
-RECENT CONVERSATION:
-{conversation}
+# Prompt for memory extraction. The fixed instructions come first and the
+# per-turn data last, so successive calls share a long identical prefix the
+# server can reuse from its prompt cache instead of prefilling it again.
+_MEMORY_PROMPT = """Analyze if the recent exchanges below warrant a memory update.
 
 SECTION RULES - what each section is based on:
 - notes: ONLY from USER's message - facts user explicitly stated (name, hobbies, preferences)
@@ -60,20 +57,86 @@ Examples:
 - New user fact: {{"notes": "[existing notes]. [new fact about user]"}}
 - Impression shift: {{"impression": "feeling more relaxed today"}}
 - Multiple sections: {{"mood": "excited", "relationship": "bonding over shared interest"}}
+
+CURRENT MEMORY (turns since last update):
+{current_memory}
+
+RECENT CONVERSATION:
+{conversation}
 """
 
-# Pattern to extract JSON from response
-_JSON_PATTERN = re.compile(r'\{[^{}]*\}', re.DOTALL)
+
+def _split_template(template: str) -> list[str]:
+    """Return the literal text around each replacement field of *template*."""
+    parts = [""]
+    for literal, field, _, _ in string.Formatter().parse(template):
+        parts[-1] += literal
+        if field is not None:
+            parts.append("")
+    return parts
+
+
+# The template split once around {current_memory} and {conversation} (in
+# that order), with the {{ }} escapes already resolved, so building the
+# prompt each turn is plain concatenation rather than str.format()
+_PROMPT_HEAD, _PROMPT_MID, _PROMPT_TAIL = _split_template(_MEMORY_PROMPT)
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _find_json_object(text: str) -> dict | None:
+    """
+    Return the first JSON object embedded in *text*, or None.
+
+    raw_decode() parses straight from each '{' in C, so nested objects and
+    braces inside string values are handled without a regex pass.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(obj, dict):
+                return obj
+        start = text.find("{", start + 1)
+    return None
+
+
+def _brace_span(text: str) -> str | None:
+    """
+    Return the first balanced {...} span in *text*, or None.
+
+    Fallback for replies that aren't valid JSON (e.g. Python dict syntax);
+    a plain depth count, so braces inside string values aren't special.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    for end in range(start, len(text)):
+        char = text[end]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:end + 1]
+    return None
+
+
+# Sections shown to the analyzer, in prompt order
+_ANALYZED_SECTIONS = ("notes", "mood", "impression", "relationship")
 
 
 def _format_memory_with_turns(status: "StatusManager") -> str:
     """Format memory with turn counts for the analyzer."""
-    turn_info = status.get_turn_info()
+    snapshot = status.snapshot()
     lines = []
 
-    for key in ["notes", "mood", "impression", "relationship"]:
-        content = status.get_section(key)
-        turns = turn_info.get(key, 0)
+    for key in _ANALYZED_SECTIONS:
+        content, turns = snapshot.get(key, ("", 0))
         if content:
             lines.append(f"• {key} ({turns} turns ago): {content}")
         else:
@@ -82,6 +145,42 @@ def _format_memory_with_turns(status: "StatusManager") -> str:
     return "\n".join(lines) if lines else "(empty)"
 
 
+# User messages that never carry anything worth remembering. Bare yes/no
+# style answers are left out: replying to the AI's question is a fact.
+_TRIVIAL_MESSAGES = frozenset({
+    "hi", "hello", "hey", "yo", "ok", "okay", "k", "kk", "cool", "nice",
+    "lol", "lmao", "haha", "thanks", "thank you", "thx", "ty", "bye",
+    "good night", "gn",
+})
+
+# Only skip while some section was updated this recently (this session)
+_TRIVIAL_SKIP_TURNS = 3
+
+
+def _is_trivial_exchange(
+    messages: list[dict[str, str]], status: StatusManager, new_turns: int = 1
+) -> bool:
+    """
+    True if an analyzer call isn't worth making for these messages.
+
+    That is when the user messages of the `new_turns` turns not analyzed
+    yet (the trailing ones; earlier turns in the window were covered by a
+    previous call) are all bare greetings or acknowledgements, and a
+    section was updated in the last few turns.
+    """
+    since = status.get_turns_since_any_update()
+    if since is None or since >= _TRIVIAL_SKIP_TURNS:
+        return False
+    user_messages = [m["content"] for m in messages if m["role"] == "user"]
+    new_messages = user_messages[-new_turns:] if new_turns > 0 else user_messages
+    if not new_messages:
+        return False
+    for content in new_messages:
+        if content.strip().rstrip("!.?~").lower() not in _TRIVIAL_MESSAGES:
+            return False
+    return True
+
+
 def _format_conversation(messages: list[dict[str, str]]) -> str:
     """Format message history as conversation text."""
     lines = []
@@ -95,6 +194,7 @@ async def update_memory_from_conversation(
     messages: list[dict[str, str]],
     status: StatusManager,
     llm: LLMEngine,
+    new_turns: int = 1,
 ) -> bool:
     """
     Analyze recent conversation turns and update memory via separate LLM call.
@@ -103,19 +203,24 @@ async def update_memory_from_conversation(
         messages: Recent conversation messages (user/assistant pairs)
         status: StatusManager instance
         llm: LLMEngine instance
+        new_turns: How many trailing turns of messages weren't analyzed yet
 
     Returns True if memory was updated.
     """
     # Increment turn counter first
     status.increment_turn()
 
+    if _is_trivial_exchange(messages, status, new_turns):
+        log.debug("Memory analyzer skipped: trivial exchange")
+        return False
+
     # Build current memory string with turn info
     current_memory = _format_memory_with_turns(status)
 
     # Build the analysis prompt
-    prompt = _MEMORY_PROMPT.format(
-        current_memory=current_memory,
-        conversation=_format_conversation(messages),
+    prompt = (
+        f"{_PROMPT_HEAD}{current_memory}"
+        f"{_PROMPT_MID}{_format_conversation(messages)}{_PROMPT_TAIL}"
     )
 
     # Make LLM call (non-streaming, just get full response)
@@ -136,19 +241,16 @@ async def update_memory_from_conversation(
         return False
 
     # Parse JSON from response
+    raw = None
     try:
-        # Try to find JSON object in response
-        json_match = _JSON_PATTERN.search(response)
-        if not json_match:
-            log.debug("No JSON found in memory analyzer response")
-            return False
-
-        raw = json_match.group()
         # Normalize smart/curly quotes to ASCII quotes
-        raw = raw.replace("\u201c", '"').replace("\u201d", '"').replace("\u2018", "'").replace("\u2019", "'")
-        try:
-            updates = json.loads(raw)
-        except json.JSONDecodeError:
+        response = response.replace("\u201c", '"').replace("\u201d", '"').replace("\u2018", "'").replace("\u2019", "'")
+        updates = _find_json_object(response)
+        if updates is None:
+            raw = _brace_span(response)
+            if raw is None:
+                log.debug("No JSON found in memory analyzer response")
+                return False
             # LLM sometimes returns single-quoted Python dict syntax
             updates = ast.literal_eval(raw)
 
@@ -178,6 +280,7 @@ async def update_memory_background(
     messages: list[dict[str, str]],
     status: StatusManager,
     llm: LLMEngine,
+    new_turns: int = 1,
 ) -> None:
     """
     Fire-and-forget memory update.
@@ -187,9 +290,116 @@ async def update_memory_background(
     """
     try:
         changed = await update_memory_from_conversation(
-            messages, status, llm
+            messages, status, llm, new_turns
         )
         if changed:
             log.info("Background memory update completed")
     except Exception as e:
         log.error("Background memory update failed: %s", e)
+
+
+# An unfinished batch is analyzed anyway once the user goes quiet this long
+_BATCH_IDLE_SECS = 20.0
+
+# How long close() waits for queued and in-flight analyses before cancelling
+_CLOSE_TIMEOUT_SECS = 10.0
+
+_Update = tuple[list[dict[str, str]], "StatusManager", "LLMEngine"]
+
+
+class MemoryUpdateWorker:
+    """
+    Runs background memory updates one at a time, batched across turns.
+
+    Each request carries the newest `window` turns, which covers up to
+    window - 1 turns before it. So the analyzer runs once every `batch`
+    submits (or after an idle pause), and due requests that queue up behind
+    the one in flight are merged into the newest, as long as the merged
+    turns still fit in one window. Fast typing can't pile up concurrent LLM
+    calls this way, and no turn falls outside every analyzed window.
+    """
+
+    def __init__(self) -> None:
+        self._pending: _Update | None = None
+        self._turns = 0  # turns covered by the pending request
+        self._window: int | None = None
+        # Due requests waiting for the worker, with the turns each covers
+        self._ready: deque[tuple[_Update, int]] = deque()
+        self._idle_flush: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def submit(
+        self,
+        messages: list[dict[str, str]],
+        status: StatusManager,
+        llm: LLMEngine,
+        batch: int = 1,
+        window: int | None = None,
+    ) -> None:
+        """
+        Queue an update; it runs once `batch` turns have accumulated.
+
+        `window` is how many turns `messages` spans (None = unbounded).
+        """
+        self._pending = (messages, status, llm)
+        self._turns += 1
+        self._window = window
+        self._cancel_idle_flush()
+        if self._turns >= batch:
+            self._flush()
+        else:
+            self._idle_flush = asyncio.get_running_loop().call_later(
+                _BATCH_IDLE_SECS, self._flush
+            )
+
+    def _flush(self) -> None:
+        """Move the pending request to the ready queue and wake the worker."""
+        self._idle_flush = None
+        if self._pending is None:
+            return
+        update, turns = self._pending, self._turns
+        self._pending = None
+        self._turns = 0
+        # A newer window covers a queued one while the turns still fit in it
+        if self._ready and (
+            self._window is None or self._ready[-1][1] + turns <= self._window
+        ):
+            turns += self._ready.pop()[1]
+        self._ready.append((update, turns))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _cancel_idle_flush(self) -> None:
+        if self._idle_flush is not None:
+            self._idle_flush.cancel()
+            self._idle_flush = None
+
+    async def _run(self) -> None:
+        while self._ready:
+            (messages, status, llm), turns = self._ready.popleft()
+            # The update counts one turn itself; credit the rest of the batch
+            for _ in range(turns - 1):
+                status.increment_turn()
+            await update_memory_background(messages, status, llm, turns)
+
+    async def close(self, timeout: float = _CLOSE_TIMEOUT_SECS) -> None:
+        """
+        Analyze any unfinished batch, then stop.
+
+        Waits up to `timeout` seconds for queued and in-flight updates,
+        then cancels whatever is still running.
+        """
+        self._cancel_idle_flush()
+        self._flush()
+        if self._task is not None and not self._task.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout)
+            except asyncio.TimeoutError:
+                log.warning("Memory update still running at shutdown, cancelling")
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+        self._ready.clear()
+        self._task = None
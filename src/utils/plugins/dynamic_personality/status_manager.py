@@ -6,6 +6,7 @@ not by parsing tags from the main conversation.
 """
 
 import logging
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -83,9 +84,18 @@ class StatusManager:
         self.filepath = Path(filepath)
         self._limits = limits if limits is not None else DEFAULT_LIMITS.copy()
         self._sections: dict[str, str] = {key: "" for key in self._limits}
-        # Turn tracking: how many turns since each section was last updated
+        # Turn tracking: the turn each section was last updated on, so
+        # "turns since update" is a subtraction and a new turn is O(1)
         self._turn_count: int = 0
-        self._turns_since_update: dict[str, int] = {key: 0 for key in self._limits}
+        self._last_updated: dict[str, int] = {key: 0 for key in self._limits}
+        # Turn of the most recent set_section() this session (None = none yet)
+        self._last_any_update: int | None = None
+        # format_for_prompt() result; reset to None whenever a section or
+        # display name changes
+        self._prompt_cache: str | None = None
+        # key -> (section text, its sentences); valid while the section
+        # still holds that exact string object
+        self._split_cache: dict[str, tuple[str, list[str]]] = {}
         self._load()
 
     # ── Limit Management ─────────────────────────────────────────────────
@@ -97,6 +107,7 @@ class StatusManager:
     def set_limit(self, key: str, limit: SectionLimit) -> None:
         """Update limits for a section (creates section if new)."""
         self._limits[key] = limit
+        self._prompt_cache = None
         if key not in self._sections:
             self._sections[key] = ""
         else:
@@ -135,6 +146,7 @@ class StatusManager:
             priority=priority,
         )
         self._sections[key] = ""
+        self._prompt_cache = None
 
     def remove_section(self, key: str) -> bool:
         """Remove a section. Returns False if it didn't exist."""
@@ -142,6 +154,8 @@ class StatusManager:
             return False
         del self._limits[key]
         self._sections.pop(key, None)
+        self._split_cache.pop(key, None)
+        self._prompt_cache = None
         return True
 
     # ── Truncation ───────────────────────────────────────────────────────
@@ -167,21 +181,28 @@ class StatusManager:
 
         return sentences
 
+    def _section_sentences(self, key: str) -> list[str]:
+        """Sentences of section *key*, re-split only when its text changed."""
+        text = self._sections[key]
+        cached = self._split_cache.get(key)
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        sentences = self._split_sentences(text)
+        self._split_cache[key] = (text, sentences)
+        return sentences
+
     def _truncate(self, key: str) -> None:
         """Enforce sentence limit by keeping newest content."""
         if key not in self._limits:
             return
 
         limit = self._limits[key]
-        text = self._sections[key].strip()
-        if not text:
-            return
-
-        sentences = self._split_sentences(text)
+        sentences = self._section_sentences(key)
         if len(sentences) > limit.max_sentences:
             # Keep the newest sentences
             sentences = sentences[-limit.max_sentences:]
             self._sections[key] = " ".join(sentences)
+            self._prompt_cache = None
 
     # ── File I/O ─────────────────────────────────────────────────────────
 
@@ -222,39 +243,50 @@ class StatusManager:
         current_key = None
         lines: list[str] = []
 
-        with self.filepath.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.rstrip("\n")
-
-                # Check if this is a header line
+        # Exact header spellings -> key; _parse_header() only sees odd ones
+        headers = {f"[{key}]": key for key in self._limits}
+        for name, key in self._HEADER_MAP.items():
+            if key in self._limits:
+                headers[f"{name}:"] = key
+                headers[f"{name.title()}:"] = key
+
+        text = self.filepath.read_text(encoding="utf-8")
+        for line in text.splitlines():
+            line = line.strip()
+            # Check if this is a header line
+            parsed_key = headers.get(line)
+            if parsed_key is None and line and (line[0] == "[" or line[-1] == ":"):
                 parsed_key = self._parse_header(line)
-                if parsed_key is not None:
-                    # Save previous section
-                    if current_key and lines:
-                        self._sections[current_key] = " ".join(lines).strip()
-                        self._truncate(current_key)
-                    # Start new section
-                    current_key = parsed_key
-                    lines = []
-                elif current_key and line.strip():
-                    lines.append(line.strip())
+            if parsed_key is not None:
+                # Save previous section
+                if current_key and lines:
+                    self._sections[current_key] = " ".join(lines).strip()
+                    self._truncate(current_key)
+                # Start new section
+                current_key = parsed_key
+                lines = []
+            elif current_key and line:
+                lines.append(line)
 
         # Save last section
         if current_key and lines:
             self._sections[current_key] = " ".join(lines).strip()
             self._truncate(current_key)
 
+        self._prompt_cache = None
         log.info("Memory loaded from: %s", self.filepath)
 
     def save(self) -> None:
-        """Write current sections to file."""
+        """Write current sections to file (atomically, via a temp file)."""
+        parts: list[str] = []
+        for key, content in self._sections.items():
+            if content.strip():
+                parts.append(f"[{key}]\n{content.strip()}\n\n")
+
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
-        with self.filepath.open("w", encoding="utf-8") as f:
-            for key, content in self._sections.items():
-                if content.strip():
-                    f.write(f"[{key}]\n")
-                    f.write(content.strip())
-                    f.write("\n\n")
+        tmp = self.filepath.with_suffix(self.filepath.suffix + ".tmp")
+        tmp.write_text("".join(parts), encoding="utf-8")
+        os.replace(tmp, self.filepath)
         log.info("Memory saved to: %s", self.filepath)
 
     # ── Prompt Formatting ────────────────────────────────────────────────
@@ -265,7 +297,11 @@ class StatusManager:
 
         Returns empty string if no memory exists.
         """
+        if self._prompt_cache is not None:
+            return self._prompt_cache
+
         if not any(self._sections.values()):
+            self._prompt_cache = ""
             return ""
 
         lines = ["[Your current memory — use this to stay consistent:]"]
@@ -274,7 +310,8 @@ class StatusManager:
                 display_name = self._limits[key].display_name
                 lines.append(f"• {display_name}: {content}")
 
-        return "\n".join(lines)
+        self._prompt_cache = "\n".join(lines)
+        return self._prompt_cache
 
     # ── Section Access ───────────────────────────────────────────────────
 
@@ -287,9 +324,11 @@ class StatusManager:
         if key not in self._limits:
             return False
         self._sections[key] = content.strip()
+        self._prompt_cache = None
         self._truncate(key)
         # Reset turn counter for this section
-        self._turns_since_update[key] = 0
+        self._last_updated[key] = self._turn_count
+        self._last_any_update = self._turn_count
         return True
 
     def get_stats(self) -> dict[str, dict]:
@@ -297,13 +336,13 @@ class StatusManager:
         stats = {}
         for key, content in self._sections.items():
             limit = self._limits[key]
-            sentences = self._split_sentences(content)
+            sentences = self._section_sentences(key)
             stats[key] = {
                 "display_name": limit.display_name,
                 "sentence_count": len(sentences),
                 "sentence_limit": limit.max_sentences,
                 "is_empty": not content.strip(),
-                "turns_since_update": self._turns_since_update.get(key, 0),
+                "turns_since_update": self.get_turns_since_update(key),
             }
         return stats
 
@@ -312,8 +351,6 @@ class StatusManager:
     def increment_turn(self) -> None:
         """Call after each conversation turn to track staleness."""
         self._turn_count += 1
-        for key in self._turns_since_update:
-            self._turns_since_update[key] += 1
 
     def get_turn_count(self) -> int:
         """Get total turns since session started."""
@@ -321,16 +358,33 @@ class StatusManager:
 
     def get_turns_since_update(self, key: str) -> int:
         """Get turns since a specific section was last updated."""
-        return self._turns_since_update.get(key, 0)
+        return self._turn_count - self._last_updated.get(key, self._turn_count)
+
+    def get_turns_since_any_update(self) -> int | None:
+        """Get turns since any section was updated this session, or None if none was."""
+        if self._last_any_update is None:
+            return None
+        return self._turn_count - self._last_any_update
+
+    def snapshot(self) -> dict[str, tuple[str, int]]:
+        """Get (content, turns since update) for every section in one pass."""
+        now = self._turn_count
+        last = self._last_updated
+        return {
+            key: (content.strip(), now - last.get(key, now))
+            for key, content in self._sections.items()
+        }
 
     def get_turn_info(self) -> dict[str, int]:
         """Get turn info for all sections (for memory updater)."""
-        return self._turns_since_update.copy()
+        now = self._turn_count
+        return {key: now - last for key, last in self._last_updated.items()}
 
     def clear_all(self) -> None:
         """Clear all memory sections."""
         for key in self._sections:
             self._sections[key] = ""
+        self._prompt_cache = None
         self.save()
         log.info("Memory: cleared all sections")
 
@@ -339,6 +393,7 @@ class StatusManager:
         if key not in self._sections:
             return False
         self._sections[key] = ""
+        self._prompt_cache = None
         self.save()
         log.info("Memory: cleared section [%s]", key)
         return True
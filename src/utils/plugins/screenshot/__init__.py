@@ -1,5 +1,17 @@
 """Screenshot plugin — capture user's screen."""
 
-from .capture import take_screenshot, get_monitors, ScreenshotResult
+from .capture import (
+    take_screenshot,
+    take_screenshot_async,
+    get_monitors,
+    invalidate_monitors,
+    ScreenshotResult,
+)
 
-__all__ = ["take_screenshot", "get_monitors", "ScreenshotResult"]
+__all__ = [
+    "take_screenshot",
+    "take_screenshot_async",
+    "get_monitors",
+    "invalidate_monitors",
+    "ScreenshotResult",
+]
@@ -6,9 +6,11 @@ Saves screenshots to temp/screenshots/ directory.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import io
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -21,7 +23,15 @@ try:
 except ImportError:
     MSS_AVAILABLE = False
 
+# Pillow encodes PNG in C; without it we fall back to mss's pure-Python encoder
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 if TYPE_CHECKING:
+    from mss.base import MSSBase
     from mss.screenshot import ScreenShot
     from src.core.config import ScreenshotConfig
 
@@ -31,6 +41,20 @@ log = logging.getLogger(__name__)
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
 _DEFAULT_OUTPUT_DIR = _PROJECT_ROOT / "temp" / "screenshots"
 
+# One mss instance per thread (its display handles are thread-bound),
+# reused across captures instead of reconnecting every call
+_tls = threading.local()
+
+# Monitor layout snapshot. mss caches the layout per instance, so when it
+# expires after _MONITOR_CACHE_SECS the calling thread's instance is
+# replaced to re-query it; invalidate_monitors() (or a failed grab) bumps
+# _sct_generation so every thread reconnects. Grabs use explicit regions
+# from the snapshot, so other threads' older instances stay usable.
+_MONITOR_CACHE_SECS = 2.0
+_mon_cache: list[MonitorInfo] | None = None
+_mon_cache_ts = 0.0
+_sct_generation = 0
+
 
 @dataclass
 class MonitorInfo:
@@ -55,26 +79,50 @@ class MonitorInfo:
 @dataclass
 class ScreenshotResult:
     """Result of a screenshot capture."""
-    path: Path
+    path: Path | None  # None when the capture wasn't saved to disk
     width: int
     height: int
     monitor_index: int
     timestamp: float
-    _png_bytes: bytes = field(default=b"", repr=False)
+    _image_bytes: bytes = field(default=b"", repr=False)
+    image_format: str = "png"  # "png" or "jpeg"
+    _base64: str | None = field(default=None, repr=False, compare=False)
 
     @property
     def filename(self) -> str:
-        return self.path.name
+        return self.path.name if self.path is not None else ""
 
     @property
     def base64(self) -> str:
-        """Return base64-encoded PNG for VLM APIs."""
-        return base64.b64encode(self._png_bytes).decode("utf-8")
+        """Return the base64-encoded image for VLM APIs (encoded once, then cached)."""
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self._image_bytes).decode("ascii")
+        return self._base64
+
+    @property
+    def image_bytes(self) -> bytes:
+        """Return the raw encoded image bytes, in image_format."""
+        return self._image_bytes
 
     @property
     def png_bytes(self) -> bytes:
-        """Return raw PNG bytes."""
-        return self._png_bytes
+        """
+        Return raw PNG bytes.
+
+        Raises:
+            ValueError: If the capture was encoded as another format
+                        (use image_bytes for those).
+        """
+        if self.image_format != "png":
+            raise ValueError(
+                f"Screenshot was encoded as {self.image_format}, not png; "
+                f"use image_bytes"
+            )
+        return self._image_bytes
+
+    @property
+    def mime_type(self) -> str:
+        return f"image/{self.image_format}"
 
     def to_vlm_content(self, detail: str = "auto") -> dict:
         """
@@ -89,7 +137,7 @@ class ScreenshotResult:
         return {
             "type": "image_url",
             "image_url": {
-                "url": f"data:image/png;base64,{self.base64}",
+                "url": f"data:{self.mime_type};base64,{self.base64}",
                 "detail": detail,
             },
         }
@@ -104,27 +152,104 @@ def _ensure_mss() -> None:
         )
 
 
+def _get_sct() -> MSSBase:
+    """Return this thread's mss instance, creating it on first use."""
+    sct = getattr(_tls, "sct", None)
+    if sct is not None and _tls.generation != _sct_generation:
+        _reset_sct()
+        sct = None
+    if sct is None:
+        sct = mss.mss()
+        _tls.sct = sct
+        _tls.generation = _sct_generation
+    return sct
+
+
+def _reset_sct() -> None:
+    """Drop this thread's mss instance so the next call reconnects."""
+    sct = getattr(_tls, "sct", None)
+    _tls.sct = None
+    if sct is not None:
+        try:
+            sct.close()
+        except Exception:
+            pass
+
+
+# JPEG quality for VLM payloads — far smaller than PNG, still legible text
+_JPEG_QUALITY = 85
+
+
+def _encode_image(screenshot: ScreenShot, image_format: str) -> tuple[bytes, str]:
+    """
+    Encode a capture, returning (bytes, actual format).
+
+    PNG uses Pillow when available, else mss's encoder. JPEG needs Pillow
+    and falls back to PNG without it.
+    """
+    if not PIL_AVAILABLE:
+        if image_format != "png":
+            log.debug("Pillow not installed, encoding screenshot as PNG")
+        return mss.tools.to_png(screenshot.rgb, screenshot.size), "png"
+
+    # Decode mss's raw BGRA buffer straight into RGB in C; .bgra and .rgb
+    # would each materialize another full-frame copy first
+    img = Image.frombuffer(
+        "RGB", screenshot.size, screenshot.raw, "raw", "BGRX", 0, 1
+    )
+    buf = io.BytesIO()
+    if image_format == "jpeg":
+        img.save(buf, format="JPEG", quality=_JPEG_QUALITY)
+    else:
+        # Fastest zlib level: the encode dominates capture time
+        img.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue(), image_format
+
+
+def invalidate_monitors() -> None:
+    """Forget the cached monitor layout (call after a display change)."""
+    global _mon_cache, _sct_generation
+    _mon_cache = None
+    _sct_generation += 1
+
+
 def get_monitors() -> list[MonitorInfo]:
     """
     Get list of available monitors.
 
+    The layout is cached for a couple of seconds; see invalidate_monitors().
+
     Returns:
         List of MonitorInfo objects. Index 0 is all monitors combined,
         indices 1+ are individual monitors.
     """
+    global _mon_cache, _mon_cache_ts
     _ensure_mss()
 
-    with mss.mss() as sct:
-        monitors = []
-        for i, mon in enumerate(sct.monitors):
-            monitors.append(MonitorInfo(
-                index=i,
-                left=mon["left"],
-                top=mon["top"],
-                width=mon["width"],
-                height=mon["height"],
-            ))
-        return monitors
+    if _mon_cache is not None:
+        if time.monotonic() - _mon_cache_ts < _MONITOR_CACHE_SECS:
+            return list(_mon_cache)
+        # Expired: a fresh instance re-reads the layout
+        _reset_sct()
+
+    try:
+        sct_monitors = _get_sct().monitors
+    except Exception:
+        _reset_sct()
+        raise
+
+    monitors = []
+    for i, mon in enumerate(sct_monitors):
+        monitors.append(MonitorInfo(
+            index=i,
+            left=mon["left"],
+            top=mon["top"],
+            width=mon["width"],
+            height=mon["height"],
+        ))
+    _mon_cache = monitors
+    _mon_cache_ts = time.monotonic()
+    return list(monitors)
 
 
 def take_screenshot(
@@ -132,6 +257,8 @@ def take_screenshot(
     output_dir: Path | str | None = None,
     filename: str | None = None,
     config: ScreenshotConfig | None = None,
+    save: bool = True,
+    image_format: str = "png",
 ) -> ScreenshotResult:
     """
     Capture a screenshot of the specified monitor.
@@ -143,77 +270,127 @@ def take_screenshot(
                     or temp/screenshots/.
         filename: Custom filename (without extension). Defaults to timestamp.
         config: Optional ScreenshotConfig for defaults.
+        save: Write the image to output_dir. With False it only lives in
+              memory (e.g. for a VLM call) and result.path is None.
+        image_format: "png" (lossless, default) or "jpeg". JPEG makes a much
+                      smaller base64 payload for VLM calls.
 
     Returns:
         ScreenshotResult with path and metadata.
 
     Raises:
         ImportError: If mss is not installed.
-        ValueError: If monitor index is invalid.
+        ValueError: If monitor index or image_format is invalid.
     """
     _ensure_mss()
 
+    image_format = image_format.lower()
+    if image_format == "jpg":
+        image_format = "jpeg"
+    if image_format not in ("png", "jpeg"):
+        raise ValueError(
+            f"Unsupported image format {image_format!r}. "
+            f"Available: 'png' or 'jpeg'"
+        )
+
     # Apply config defaults
     if monitor is None:
         monitor = config.default_monitor if config else 1
-    if output_dir is None:
-        output_dir = config.output_dir if config else _DEFAULT_OUTPUT_DIR
-
-    # Resolve output directory
-    save_dir = Path(output_dir)
-    save_dir.mkdir(parents=True, exist_ok=True)
 
     timestamp = time.time()
 
-    # Generate filename
-    if filename:
-        fname = f"{filename}.png"
-    else:
-        # Format: screenshot_YYYYMMDD_HHMMSS_monitor.png
-        time_str = time.strftime("%Y%m%d_%H%M%S", time.localtime(timestamp))
-        fname = f"screenshot_{time_str}_mon{monitor}.png"
-
-    output_path = save_dir / fname
-
-    with mss.mss() as sct:
-        # Validate monitor index
-        if monitor < 0 or monitor >= len(sct.monitors):
-            available = len(sct.monitors) - 1
-            raise ValueError(
-                f"Invalid monitor index {monitor}. "
-                f"Available: 0 (all) or 1-{available}"
-            )
+    monitors = get_monitors()
 
-        # Capture
-        mon = sct.monitors[monitor]
-        screenshot: ScreenShot = sct.grab(mon)
+    # Validate monitor index
+    if monitor < 0 or monitor >= len(monitors):
+        available = len(monitors) - 1
+        raise ValueError(
+            f"Invalid monitor index {monitor}. "
+            f"Available: 0 (all) or 1-{available}"
+        )
 
-        # Convert to PNG bytes
-        png_bytes = mss.tools.to_png(screenshot.rgb, screenshot.size)
+    # Capture
+    mon = monitors[monitor]
+    region = {"left": mon.left, "top": mon.top, "width": mon.width, "height": mon.height}
+    try:
+        screenshot: ScreenShot = _get_sct().grab(region)
+    except Exception:
+        # The layout may have changed under us; re-query it next time
+        _reset_sct()
+        invalidate_monitors()
+        raise
+
+    # Encode (PNG or JPEG)
+    image_bytes, image_format = _encode_image(screenshot, image_format)
+    ext = "jpg" if image_format == "jpeg" else "png"
+
+    output_path = None
+    if save:
+        if output_dir is None:
+            output_dir = config.output_dir if config else _DEFAULT_OUTPUT_DIR
+
+        # Resolve output directory
+        save_dir = Path(output_dir)
+        save_dir.mkdir(parents=True, exist_ok=True)
+
+        # Generate filename
+        if filename:
+            fname = f"{filename}.{ext}"
+        else:
+            # Format: screenshot_YYYYMMDD_HHMMSS_monitor.png/.jpg
+            time_str = time.strftime("%Y%m%d_%H%M%S", time.localtime(timestamp))
+            fname = f"screenshot_{time_str}_mon{monitor}.{ext}"
+
+        output_path = save_dir / fname
 
         # Save to file
         with open(output_path, "wb") as f:
-            f.write(png_bytes)
+            f.write(image_bytes)
 
-        log.info(
-            "Screenshot captured: %s (%dx%d, monitor %d)",
-            output_path.name, screenshot.width, screenshot.height, monitor
-        )
+    log.info(
+        "Screenshot captured: %s (%dx%d, monitor %d)",
+        output_path.name if output_path else "<memory>",
+        screenshot.width, screenshot.height, monitor
+    )
 
-        return ScreenshotResult(
-            path=output_path,
-            width=screenshot.width,
-            height=screenshot.height,
-            monitor_index=monitor,
-            timestamp=timestamp,
-            _png_bytes=png_bytes,
-        )
+    return ScreenshotResult(
+        path=output_path,
+        width=screenshot.width,
+        height=screenshot.height,
+        monitor_index=monitor,
+        timestamp=timestamp,
+        _image_bytes=image_bytes,
+        image_format=image_format,
+    )
+
+
+async def take_screenshot_async(
+    monitor: int | None = None,
+    output_dir: Path | str | None = None,
+    filename: str | None = None,
+    config: ScreenshotConfig | None = None,
+    save: bool = True,
+    image_format: str = "png",
+) -> ScreenshotResult:
+    """
+    Async take_screenshot() for use on the event loop.
+
+    Grabbing, PNG encoding and the file write all run in a worker thread,
+    so LLM streaming and TTS keep going while a capture is in progress.
+    """
+    return await asyncio.to_thread(
+        take_screenshot,
+        monitor=monitor, output_dir=output_dir, filename=filename, config=config,
+        save=save, image_format=image_format,
+    )
 
 
 def take_screenshot_all_monitors(
     output_dir: Path | str | None = None,
     filename: str | None = None,
     config: ScreenshotConfig | None = None,
+    save: bool = True,
+    image_format: str = "png",
 ) -> ScreenshotResult:
     """
     Capture a screenshot of all monitors combined.
@@ -221,5 +398,6 @@ def take_screenshot_all_monitors(
     Convenience function that calls take_screenshot with monitor=0.
     """
     return take_screenshot(
-        monitor=0, output_dir=output_dir, filename=filename, config=config
+        monitor=0, output_dir=output_dir, filename=filename, config=config,
+        save=save, image_format=image_format,
     )